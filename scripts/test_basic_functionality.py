@@ -5,17 +5,23 @@ import sys
 from pathlib import Path
 
 # Add the src directory to the path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 try:
-    from kp_dagger.core.exceptions import NetworkScannerError
-    from kp_dagger.core.scanner import kp_daggerScanner
-    from kp_dagger.models.base.enums import DeviceType
+    from kp_dagger.core import DaggerScanner, DatabaseManager
+    from kp_dagger.parsers.factory import ParserFactory
 
     print("✓ All imports successful")
 
     # Test basic scanner initialization
-    scanner = DaggerScanner(database_path=":memory:")
+    database_manager = DatabaseManager(":memory:")
+    database_manager.initialize()
+    scanner = DaggerScanner(
+        database_manager=database_manager,
+        parser_factory=ParserFactory(),
+        analyzers=None,
+        reporters=None,
+    )
     print("✓ Scanner initialized successfully")
 
     # Test device type detection
@@ -34,8 +34,26 @@ __all__: list[str] = [
     "main",  # CLI entry point
 ]
 
-# Import CLI main function when available
-import contextlib
-
-with contextlib.suppress(ImportError):
-    from kp_dagger.cli.main import main
+# Public names are resolved on first access so that ``import kp_dagger`` does
+# not pull in Click, Rich, or the database/parser stacks.
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "Database": ("kp_dagger.core.database", "Database"),
+    "ParserFactory": ("kp_dagger.parsers.factory", "ParserFactory"),
+    "Scanner": ("kp_dagger.core.scanner", "Scanner"),
+    "main": ("kp_dagger.cli.main", "main"),
+}
+
+
+def __getattr__(name: str) -> object:
+    """Lazily import the public API on first attribute access (PEP 562)."""
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), attribute)
+    globals()[name] = value
+    return value
@@ -8,13 +8,20 @@ and compliance checking.
 from pathlib import Path
 
 import click
-from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
-from kp_dagger.cli.utils.output import RichCommand, error_console, success_console
-
-console = Console()
+from kp_dagger.cli.utils.helpers import expand_config_paths
+from kp_dagger.cli.utils.options import (
+    ANALYSIS_FORMAT_CHOICE,
+    DEVICE_TYPE_CHOICE,
+    SEVERITY_CHOICE,
+)
+from kp_dagger.cli.utils.output import (
+    RichCommand,
+    get_console,
+    get_error_console,
+    get_success_console,
+)
 
 
 @click.command(cls=RichCommand)
@@ -26,10 +33,7 @@ console = Console()
 )
 @click.option(
     "--device-type",
-    type=click.Choice(
-        ["auto", "cisco-ios", "cisco-asa", "fortigate", "paloalto"],
-        case_sensitive=False,
-    ),
+    type=DEVICE_TYPE_CHOICE,
     default="auto",
     help="Device type for configuration parsing (default: auto-detect).",
 )
@@ -42,16 +46,13 @@ console = Console()
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["json", "yaml", "table"], case_sensitive=False),
+    type=ANALYSIS_FORMAT_CHOICE,
     default="table",
     help="Output format for analysis results.",
 )
 @click.option(
     "--severity",
-    type=click.Choice(
-        ["all", "critical", "high", "medium", "low"],
-        case_sensitive=False,
-    ),
+    type=SEVERITY_CHOICE,
     default="all",
     help="Minimum severity level to include in results.",
 )
@@ -95,7 +96,7 @@ def analyze(
 
     ⚠️  WARNING: This is a development version and is not ready for production use.
 
-    CONFIG_FILES: One or more configuration files to analyze.
+    CONFIG_FILES: One or more configuration files or directories to analyze.
 
     Examples:
         # Analyze a single configuration file
@@ -113,7 +114,12 @@ def analyze(
     """
     verbose = ctx.obj.get("verbose", 0)
     quiet = ctx.obj.get("quiet", False)
+    config_files = tuple(expand_config_paths(config_files))
+    if not config_files:
+        get_error_console().print("❌ No configuration files found in the given paths")
+        ctx.exit(1)
 
+    console = get_console()
     if not quiet:
         console.print("\n🔍 [bold blue]Starting Configuration Analysis[/bold blue]\n")
 
@@ -169,10 +175,10 @@ def analyze(
         # Save output if specified
         if output:
             _save_results(output, output_format)
-            success_console.print(f"✅ Results saved to: {output}")
+            get_success_console().print(f"✅ Results saved to: {output}")
 
     except Exception as e:
-        error_console.print(f"❌ Analysis failed: {e}")
+        get_error_console().print(f"❌ Analysis failed: {e}")
         if verbose > 0:
             console.print_exception()
         ctx.exit(1)
@@ -189,25 +195,26 @@ def _show_analysis_config(
     parallel: int,
 ) -> None:
     """Display analysis configuration details."""
-    table = Table(title="Analysis Configuration", show_header=False)
-    table.add_column("Setting", style="cyan")
-    table.add_column("Value", style="white")
-
-    table.add_row("Files", f"{len(config_files)} configuration file(s)")
-    table.add_row("Device Type", device_type)
-    table.add_row("Output Format", output_format)
-    table.add_row("Severity Filter", severity)
-    table.add_row("Include Passed", "Yes" if include_passed else "No")
-    table.add_row("CIS Benchmarks", "Yes" if cis_benchmarks else "No")
-    table.add_row("Vulnerability Check", "Yes" if vulnerability_check else "No")
-    table.add_row("Parallel Threads", str(parallel))
-
-    console.print(table)
-    console.print()
+    settings = (
+        ("Files", f"{len(config_files)} configuration file(s)"),
+        ("Device Type", device_type),
+        ("Output Format", output_format),
+        ("Severity Filter", severity),
+        ("Include Passed", "Yes" if include_passed else "No"),
+        ("CIS Benchmarks", "Yes" if cis_benchmarks else "No"),
+        ("Vulnerability Check", "Yes" if vulnerability_check else "No"),
+        ("Parallel Threads", str(parallel)),
+    )
+    lines = [f"  [cyan]{name}:[/cyan] {value}" for name, value in settings]
+    get_console().print("[bold]Analysis Configuration[/bold]", *lines, "", sep="\n")
 
 
 def _show_analysis_results(output_format: str, include_passed: bool) -> None:
     """Display analysis results."""
+    from rich.table import Table
+
+    console = get_console()
+
     # TODO: Replace with actual results
     console.print("📊 [bold green]Analysis Complete[/bold green]\n")
 
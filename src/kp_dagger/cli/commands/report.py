@@ -7,13 +7,18 @@ Handles report generation from analysis results including HTML, JSON, and Excel
 from pathlib import Path
 
 import click
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
-from kp_dagger.cli.utils.output import RichCommand, error_console, success_console
-
-console = Console()
+from kp_dagger.cli.utils.options import (
+    REPORT_FORMAT_CHOICE,
+    REPORT_TEMPLATE_CHOICE,
+    SEVERITY_CHOICE,
+)
+from kp_dagger.cli.utils.output import (
+    RichCommand,
+    get_console,
+    get_error_console,
+    get_success_console,
+)
 
 
 @click.command(cls=RichCommand)
@@ -31,16 +36,13 @@ console = Console()
 @click.option(
     "--format",
     "output_format",
-    type=click.Choice(["html", "json", "excel", "pdf"], case_sensitive=False),
+    type=REPORT_FORMAT_CHOICE,
     default="html",
     help="Report format.",
 )
 @click.option(
     "--template",
-    type=click.Choice(
-        ["default", "executive", "technical", "compliance"],
-        case_sensitive=False,
-    ),
+    type=REPORT_TEMPLATE_CHOICE,
     default="default",
     help="Report template to use.",
 )
@@ -51,10 +53,7 @@ console = Console()
 )
 @click.option(
     "--severity-filter",
-    type=click.Choice(
-        ["all", "critical", "high", "medium", "low"],
-        case_sensitive=False,
-    ),
+    type=SEVERITY_CHOICE,
     default="all",
     help="Minimum severity level to include in report.",
 )
@@ -100,7 +99,7 @@ def report(  # noqa: PLR0913
     quiet = ctx.obj.get("quiet", False)
 
     if not quiet:
-        console.print("\n📊 [bold blue]Generating Report[/bold blue]\n")
+        get_console().print("\n📊 [bold blue]Generating Report[/bold blue]\n")
 
     # Auto-generate output filename if not provided
     if not output:
@@ -118,10 +117,12 @@ def report(  # noqa: PLR0913
         )
 
     try:
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
-            console=console,
+            console=get_console(),
         ) as progress:
             # Load analysis results
             progress.add_task("Loading analysis results...", total=None)
@@ -139,32 +140,35 @@ def report(  # noqa: PLR0913
             _save_report(output, output_format, template)
 
         if not quiet:
-            success_console.print(f"✅ Report generated: {output}")
+            get_success_console().print(f"✅ Report generated: {output}")
 
         # Open report if requested
         if open_report:
             _open_report(output)
             if not quiet:
-                console.print(f"🔗 Opened report: {output}")
+                get_console().print(f"🔗 Opened report: {output}")
 
     except Exception as e:
-        error_console.print(f"❌ Report generation failed: {e}")
+        get_error_console().print(f"❌ Report generation failed: {e}")
         if verbose > 0:
-            console.print_exception()
+            get_console().print_exception()
         ctx.exit(1)
 
 
 def _generate_output_filename(input_file: Path, output_format: str) -> Path:
     """Generate output filename based on input file and format."""
-    stem = input_file.stem
-    extension_map = {
-        "html": ".html",
-        "json": ".json",
-        "excel": ".xlsx",
-        "pdf": ".pdf",
-    }
-    extension = extension_map.get(output_format, ".html")
-    return input_file.parent / f"{stem}_report{extension}"
+    match output_format.lower():
+        case "html":
+            extension = ".html"
+        case "json":
+            extension = ".json"
+        case "excel":
+            extension = ".xlsx"
+        case "pdf":
+            extension = ".pdf"
+        case _:
+            extension = ".html"
+    return input_file.parent / f"{input_file.stem}_report{extension}"
 
 
 def _show_report_config(
@@ -176,6 +180,8 @@ def _show_report_config(
     severity_filter: str,
 ) -> None:
     """Display report configuration details."""
+    from rich.table import Table
+
     table = Table(title="Report Configuration", show_header=False)
     table.add_column("Setting", style="cyan")
     table.add_column("Value", style="white")
@@ -187,6 +193,7 @@ def _show_report_config(
     table.add_row("Include Passed", "Yes" if include_passed else "No")
     table.add_row("Severity Filter", severity_filter)
 
+    console = get_console()
     console.print(table)
     console.print()
 
@@ -213,17 +220,22 @@ def _save_report(output: Path, output_format: str, template: str) -> None:
 
 
 def _open_report(output: Path) -> None:
-    """Open the generated report in the default application."""
+    """Open the generated report in the default application without blocking."""
+    import os
     import subprocess
     import sys
 
     try:
         if sys.platform == "win32":
-            subprocess.run(["start", str(output)], shell=True, check=False)
-        elif sys.platform == "darwin":
-            subprocess.run(["open", str(output)], check=False)
+            # ShellExecute directly instead of spawning cmd.exe for "start"
+            os.startfile(str(output))  # noqa: S606
         else:
-            subprocess.run(["xdg-open", str(output)], check=False)
+            opener = "open" if sys.platform == "darwin" else "xdg-open"
+            subprocess.Popen(  # noqa: S603
+                [opener, str(output)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
     except Exception:
         # Silently fail if we can't open the report
         pass
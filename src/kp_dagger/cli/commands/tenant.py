@@ -5,11 +5,8 @@ Handles tenant management including creation, deletion, and listing of tenants.
 """
 
 import click
-from rich.console import Console
 
-from kp_dagger.cli.utils.output import RichCommand, RichGroup, success_console
-
-console = Console()
+from kp_dagger.cli.utils.output import RichCommand, RichGroup, get_success_console
 
 
 @click.group("tenant", cls=RichGroup)
@@ -34,7 +31,7 @@ def create(name: str) -> None:
         Dagger tenant create "my-tenant"
 
     """
-    success_console.print(f"✅ Created tenant configuration for: {name}")
+    get_success_console().print(f"✅ Created tenant configuration for: {name}")
 
 
 @tenant.command("list", cls=RichCommand)
@@ -49,7 +46,7 @@ def list_tenants() -> None:
         Dagger tenant list
 
     """
-    success_console.print("📋 Listing all tenant configurations...")
+    get_success_console().print("📋 Listing all tenant configurations...")
     # Implementation will be added later
 
 
@@ -78,8 +75,8 @@ def delete(name: str, *, force: bool = False) -> None:
     if not force and not click.confirm(
         f"Are you sure you want to delete tenant '{name}'?",
     ):
-        success_console.print("❌ Deletion cancelled.")
+        get_success_console().print("❌ Deletion cancelled.")
         return
 
-    success_console.print(f"🗑️  Deleted tenant configuration: {name}")
+    get_success_console().print(f"🗑️  Deleted tenant configuration: {name}")
     # Implementation will be added later
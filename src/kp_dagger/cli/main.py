@@ -6,22 +6,43 @@ It serves as the entry point for all CLI operations.
 """
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-
-from kp_dagger.cli.commands.analyze import analyze
-from kp_dagger.cli.commands.report import report
-from kp_dagger.cli.commands.tenant import tenant
-from kp_dagger.cli.utils.config import config
-from kp_dagger.cli.utils.output import RichGroup, error_console, setup_logging
-
-console = Console()
 
+from kp_dagger.cli.utils.output import (
+    LazyRichGroup,
+    get_console,
+    get_error_console,
+    setup_logging,
+)
 
-@click.group(invoke_without_command=True, cls=RichGroup)
+# Subcommands are imported only when invoked: name -> (import path, short help)
+SUBCOMMANDS: dict[str, tuple[str, str]] = {
+    "analyze": (
+        "kp_dagger.cli.commands.analyze:analyze",
+        "Analyze configuration files for security issues.",
+    ),
+    "config": (
+        "kp_dagger.cli.utils.config:config",
+        "Manage Dagger CLI configuration.",
+    ),
+    "report": (
+        "kp_dagger.cli.commands.report:report",
+        "Generate reports from kp_dagger analysis results.",
+    ),
+    "tenant": (
+        "kp_dagger.cli.commands.tenant:tenant",
+        "Manage tenant configurations.",
+    ),
+}
+
+
+@click.group(
+    invoke_without_command=True,
+    cls=LazyRichGroup,
+    lazy_subcommands=SUBCOMMANDS,
+)
 @click.option(
     "--version",
+    "-V",
     is_flag=True,
     help="Show version information and exit.",
 )
@@ -65,6 +86,17 @@ def main(
 
     ⚠️  WARNING: This is a development version and is not ready for production use.
     """
+    # Version and bare invocations only print, so skip context and logging setup
+    if version:
+        show_version()
+        ctx.exit()
+
+    # If no command was provided, show help
+    if ctx.invoked_subcommand is None:
+        show_welcome()
+        click.echo(ctx.get_help())
+        return
+
     # Ensure that ctx.obj exists and is a dict
     ctx.ensure_object(dict)
 
@@ -92,18 +124,12 @@ def main(
     #         error_console.print(f"❌ Failed to load config: {e}", style="red")
     #         ctx.exit(1)
 
-    if version:
-        show_version()
-        ctx.exit()
-
-    # If no command was provided, show help
-    if ctx.invoked_subcommand is None:
-        show_welcome()
-        click.echo(ctx.get_help())
-
 
 def show_version() -> None:
     """Display version information."""
+    from rich.panel import Panel
+    from rich.text import Text
+
     try:
         from kp_dagger import __author__, __url__, __version__
 
@@ -119,14 +145,20 @@ def show_version() -> None:
             border_style="blue",
             padding=(1, 2),
         )
-        console.print(panel)
+        get_console().print(panel)
 
     except ImportError:
-        error_console.print("❌ Could not determine version information", style="red")
+        get_error_console().print(
+            "❌ Could not determine version information",
+            style="red",
+        )
 
 
 def show_welcome() -> None:
     """Display welcome message."""
+    from rich.panel import Panel
+    from rich.text import Text
+
     welcome_text = Text()
     welcome_text.append("🏰 Dagger\n", style="bold blue")
     welcome_text.append(
@@ -144,14 +176,7 @@ def show_welcome() -> None:
         border_style="blue",
         padding=(1, 2),
     )
-    console.print(panel)
-
-
-# Add subcommands
-main.add_command(analyze)
-main.add_command(config)
-main.add_command(report)
-main.add_command(tenant)
+    get_console().print(panel)
 
 
 if __name__ == "__main__":
@@ -5,69 +5,116 @@ Handles configuration file loading, validation, and management for the CLI inter
 """
 
 import json
+from collections.abc import Mapping
+from functools import cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, ClassVar
 
 import click
-from rich.console import Console
 
-from kp_dagger.cli.utils.output import print_error, print_info
+from kp_dagger.cli.utils.output import get_console, print_error, print_info
 
-console = Console()
+# Parsed user configuration keyed by path: (st_mtime_ns, st_size, parsed config)
+_CONFIG_CACHE: dict[Path, tuple[int, int, dict[str, Any]]] = {}
+
+
+@cache
+def _default_config_path() -> Path:
+    """Resolve the default configuration file path once per process."""
+    # Use user's home directory for config; save() creates it on first write
+    return Path.home() / ".Dagger" / "config.json"
 
 
 class ConfigManager:
     """Manages CLI configuration settings."""
 
-    DEFAULT_CONFIG: ClassVar[dict[str, Any]] = {
-        "output_format": "table",
-        "verbose": 0,
-        "parallel_jobs": 1,
-        "default_device_type": "auto",
-        "include_passed_checks": False,
-        "severity_filter": "all",
-        "report_template": "default",
-    }
+    __slots__ = ("_saved_config", "config", "config_path")
+
+    DEFAULT_CONFIG: ClassVar[Mapping[str, Any]] = MappingProxyType(
+        {
+            "output_format": "table",
+            "verbose": 0,
+            "parallel_jobs": 1,
+            "default_device_type": "auto",
+            "include_passed_checks": False,
+            "severity_filter": "all",
+            "report_template": "default",
+        },
+    )
+    _SORTED_KEYS: ClassVar[tuple[str, ...]] = tuple(sorted(DEFAULT_CONFIG))
 
     def __init__(self, config_path: Path | None = None) -> None:
         """Initialize configuration manager."""
         self.config_path = config_path or self._get_default_config_path()
-        self.config = self.DEFAULT_CONFIG.copy()
+        self.config: dict[str, Any] = dict(self.DEFAULT_CONFIG)
+        # Configuration as last read from or written to disk (None if unknown)
+        self._saved_config: dict[str, Any] | None = None
         self.load()
 
     def _get_default_config_path(self) -> Path:
         """Get the default configuration file path."""
-        # Use user's home directory for config
-        config_dir = Path.home() / ".Dagger"
-        config_dir.mkdir(exist_ok=True)
-        return config_dir / "config.json"
+        return _default_config_path()
 
     def load(self) -> None:
-        """Load configuration from file."""
-        if not self.config_path.exists():
+        """
+        Load configuration from file.
+
+        The parsed file is cached per path and reused for as long as the
+        file's modification time and size are unchanged.
+        """
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
             print_info(
                 f"No configuration file found at {self.config_path}, using defaults",
             )
             return
-
-        try:
-            with self.config_path.open("r", encoding="utf-8") as f:
-                user_config = json.load(f)
-
-            # Merge with defaults
-            self.config.update(user_config)
-            print_info(f"Loaded configuration from {self.config_path}")
-
-        except (json.JSONDecodeError, OSError) as e:
+        except OSError as e:
             print_error(f"Failed to load configuration: {e}")
             print_info("Using default configuration")
+            return
+
+        cached = _CONFIG_CACHE.get(self.config_path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            user_config = cached[2]
+        else:
+            try:
+                user_config = json.loads(self.config_path.read_bytes())
+            except (json.JSONDecodeError, OSError) as e:
+                print_error(f"Failed to load configuration: {e}")
+                print_info("Using default configuration")
+                return
+            _CONFIG_CACHE[self.config_path] = (
+                stat.st_mtime_ns,
+                stat.st_size,
+                user_config,
+            )
+
+        # Merge with defaults
+        self.config.update(user_config)
+        self._saved_config = self.config.copy()
+        print_info(f"Loaded configuration from {self.config_path}")
 
     def save(self) -> None:
-        """Save current configuration to file."""
+        """
+        Save current configuration to file.
+
+        The file is not rewritten when the configuration is unchanged since it
+        was loaded or last saved.
+        """
+        if self.config == self._saved_config:
+            print_info(f"Configuration unchanged at {self.config_path}")
+            return
+
+        _CONFIG_CACHE.pop(self.config_path, None)
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            with self.config_path.open("w", encoding="utf-8") as f:
-                json.dump(self.config, f, indent=2)
+            self.config_path.write_text(
+                json.dumps(self.config, indent=2),
+                encoding="utf-8",
+            )
+            self._saved_config = self.config.copy()
             print_info(f"Configuration saved to {self.config_path}")
         except OSError as e:
             print_error(f"Failed to save configuration: {e}")
@@ -85,8 +132,9 @@ class ConfigManager:
         self.config[key] = value
 
     def reset(self) -> None:
-        """Reset configuration to defaults."""
-        self.config: dict[str, Any] = self.DEFAULT_CONFIG.copy()
+        """Reset configuration to defaults, keeping the same config dict."""
+        self.config.clear()
+        self.config.update(self.DEFAULT_CONFIG)
 
     def show(self) -> None:
         """Display current configuration."""
@@ -96,10 +144,49 @@ class ConfigManager:
         table.add_column("Setting", style="cyan")
         table.add_column("Value", style="white")
 
-        for key, value in sorted(self.config.items()):
-            table.add_row(key, str(value))
+        for key in self._SORTED_KEYS:
+            table.add_row(key, str(self.config.get(key, "")))
+        # Keys set by the user that have no default are listed afterwards
+        for key in sorted(self.config.keys() - self._SORTED_KEYS):
+            table.add_row(key, str(self.config[key]))
+
+        get_console().print(table)
+
+
+# Case-insensitive boolean spellings accepted by ``config --set``
+_BOOL_VALUES: dict[str, bool] = {"true": True, "false": False}
+
+
+def _coerce_option_value(raw: str) -> str | int | bool:
+    """Convert a ``config --set`` value to a bool or int where it looks like one."""
+    value = _BOOL_VALUES.get(raw.lower())
+    if value is not None:
+        return value
+    try:
+        return int(raw)
+    except ValueError:
+        return raw
 
-        console.print(table)
+
+def get_config_manager(ctx: click.Context) -> ConfigManager:
+    """
+    Get the configuration manager shared through the CLI context.
+
+    The manager is created and loaded on first use and stored in ``ctx.obj``,
+    so every command in the same invocation reuses it.
+
+    Args:
+        ctx: Click context of the running command
+
+    Returns:
+        Shared configuration manager
+
+    """
+    obj = ctx.ensure_object(dict)
+    config_manager = obj.get("config_manager")
+    if config_manager is None:
+        config_manager = obj["config_manager"] = ConfigManager()
+    return config_manager
 
 
 @click.command()
@@ -123,7 +210,7 @@ class ConfigManager:
 )
 @click.pass_context
 def config(
-    ctx: click.Context,  # noqa: ARG001
+    ctx: click.Context,
     *,
     show: bool,
     reset: bool,
@@ -145,7 +232,7 @@ def config(
         Dagger config --reset
 
     """
-    config_manager = ConfigManager()
+    config_manager = get_config_manager(ctx)
 
     if reset:
         config_manager.reset()
@@ -154,14 +241,8 @@ def config(
         return
 
     if set_option:
-        for key, _value in set_option:
-            # Try to convert to appropriate type
-            if _value.lower() in ("true", "false"):
-                value = _value.lower() == "true"
-            elif _value.isdigit():
-                value = int(value)
-
-            config_manager.set(key, value)
+        for key, value in set_option:
+            config_manager.set(key, _coerce_option_value(value))
 
         config_manager.save()
         print_info(f"Updated {len(set_option)} configuration option(s)")
@@ -4,16 +4,44 @@ Common utilities for Dagger CLI.
 Contains helper functions and utilities used across different CLI commands.
 """
 
+import os
+import re
 import sys
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 
 import click
-from rich.console import Console
 
 from kp_dagger.cli.utils.output import print_error
 
-console = Console()
+# Number of characters read from the start of a file for device-type detection
+DETECTION_WINDOW_SIZE = 8192
+
+# File suffixes picked up when a directory is given as a configuration source
+CONFIG_FILE_SUFFIXES = frozenset({".cfg", ".conf", ".config", ".txt"})
+
+# Keywords used by the device-type heuristics, matched in a single regex pass.
+# The lookahead lets matches overlap so membership mirrors ``keyword in content``;
+# at a shared start position the longest alternative wins, so "config" is
+# implied by "config system global".
+_DEVICE_KEYWORDS = (
+    "config system global",
+    "config",
+    "version ",
+    "cisco",
+    "ios",
+    "asa",
+    "pix",
+    "fortigate",
+    "paloalto",
+    "panorama",
+)
+_DEVICE_KEYWORD_PATTERN = re.compile(
+    "(?=(" + "|".join(map(re.escape, _DEVICE_KEYWORDS)) + "))",
+)
+
+# Detected device types keyed by (path, st_mtime_ns, st_size)
+_DETECT_CACHE: dict[tuple[str, int, int], str] = {}
 
 
 def validate_file_extensions(
@@ -47,10 +75,47 @@ def validate_file_extensions(
     return True
 
 
+def expand_config_paths(
+    paths: Iterable[Path],
+    suffixes: frozenset[str] = CONFIG_FILE_SUFFIXES,
+) -> list[Path]:
+    """
+    Expand directories into the configuration files they contain.
+
+    Files are kept as given. Each directory is walked once with ``os.walk``
+    and its files are matched against ``suffixes`` (case-insensitively).
+
+    Args:
+        paths: Configuration files and/or directories
+        suffixes: Lower-case file suffixes to include from directories
+
+    Returns:
+        Configuration file paths, with directory contents in sorted order
+
+    """
+    files: list[Path] = []
+    for path in paths:
+        if not path.is_dir():
+            files.append(path)
+            continue
+        for root, dirs, names in os.walk(path):
+            dirs.sort()
+            root_path = Path(root)
+            files.extend(
+                root_path / name
+                for name in sorted(names)
+                if os.path.splitext(name)[1].lower() in suffixes  # noqa: PTH122
+            )
+    return files
+
+
 def detect_device_type(config_file: Path) -> str:
     """
     Auto-detect device type from configuration file.
 
+    Results are memoized per file for as long as its modification time and
+    size are unchanged.
+
     Args:
         config_file: Path to the configuration file
 
@@ -58,32 +123,50 @@ def detect_device_type(config_file: Path) -> str:
         Detected device type string
 
     """
-    max_read_lines = 50  # Limit to first 50 lines for performance
     try:
-        with config_file.open("r", encoding="utf-8", errors="ignore") as f:
-            # Read first few lines for detection
-            content = ""
-            for i, line in enumerate(f):
-                content += line.lower()
-                if i > max_read_lines:
-                    break
-
-        # Simple heuristics for device type detection
-        if "version " in content and ("cisco" in content or "ios" in content):
-            if "asa" in content or "pix" in content:
-                return "cisco-asa"
-            return "cisco-ios"
-        if "config system global" in content or "fortigate" in content:
-            return "fortigate"
-        if "config" in content and ("paloalto" in content or "panorama" in content):
-            return "paloalto"
+        stat = config_file.stat()
+    except OSError:
+        return "cisco-ios"  # Safe default
+
+    cache_key = (str(config_file), stat.st_mtime_ns, stat.st_size)
+    cached = _DETECT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
 
+    try:
+        with config_file.open("r", encoding="utf-8", errors="ignore") as f:
+            # Only the head of the file is needed for detection
+            content = f.read(DETECTION_WINDOW_SIZE).lower()
     except (OSError, UnicodeDecodeError):
         return "cisco-ios"  # Safe default
 
-    else:
-        # Default fallback
+    device_type = _classify_device_content(content)
+    _DETECT_CACHE[cache_key] = device_type
+    return device_type
+
+
+def _classify_device_content(content: str) -> str:
+    """Apply the device-type heuristics to lowercased configuration text."""
+    return _classify_device_keywords(set(_DEVICE_KEYWORD_PATTERN.findall(content)))
+
+
+def _classify_device_keywords(found: set[str]) -> str:
+    """Classify a device from the set of detection keywords found in its config."""
+    if "config system global" in found:
+        found.add("config")
+
+    # Simple heuristics for device type detection
+    if "version " in found and ("cisco" in found or "ios" in found):
+        if "asa" in found or "pix" in found:
+            return "cisco-asa"
         return "cisco-ios"
+    if "config system global" in found or "fortigate" in found:
+        return "fortigate"
+    if "config" in found and ("paloalto" in found or "panorama" in found):
+        return "paloalto"
+
+    # Default fallback
+    return "cisco-ios"
 
 
 def get_output_filename(input_file: Path, suffix: str, extension: str) -> Path:
@@ -0,0 +1,46 @@
+"""
+Click option types for the Dagger CLI commands.
+
+The Choice types for the analyze and report options are built once here so
+that their allowed values are listed in one place. Only SEVERITY_CHOICE is
+used by both commands; the others each belong to a single command.
+"""
+
+import click
+
+__all__: list[str] = [
+    "ANALYSIS_FORMAT_CHOICE",
+    "DEVICE_TYPE_CHOICE",
+    "REPORT_FORMAT_CHOICE",
+    "REPORT_TEMPLATE_CHOICE",
+    "SEVERITY_CHOICE",
+]
+
+# "auto" plus the DeviceType values. Spelled out rather than derived from the
+# enum, because importing kp_dagger.models.base.enums loads the whole model
+# package (sqlmodel) at CLI import time.
+DEVICE_TYPE_CHOICE = click.Choice(
+    ("auto", "cisco-ios", "cisco-asa", "fortigate", "paloalto"),
+    case_sensitive=False,
+)
+
+ANALYSIS_FORMAT_CHOICE = click.Choice(
+    ("json", "yaml", "table"),
+    case_sensitive=False,
+)
+
+# Minimum severity filter shared by analyze and report
+SEVERITY_CHOICE = click.Choice(
+    ("all", "critical", "high", "medium", "low"),
+    case_sensitive=False,
+)
+
+REPORT_FORMAT_CHOICE = click.Choice(
+    ("html", "json", "excel", "pdf"),
+    case_sensitive=False,
+)
+
+REPORT_TEMPLATE_CHOICE = click.Choice(
+    ("default", "executive", "technical", "compliance"),
+    case_sensitive=False,
+)
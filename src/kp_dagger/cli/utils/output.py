@@ -5,25 +5,35 @@ Provides console utilities, logging configuration, and formatted output function
 using Rich for enhanced terminal experience.
 """
 
+import atexit
+import copy
+import importlib
 import logging
+import queue
 import sys
+import time
 import types
+from functools import cache
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Self
 
 import click
 from rich.console import Console
 from rich.logging import RichHandler
+from rich.markup import escape
 from rich.panel import Panel
 from rich.text import Text
 from rich.theme import Theme
 
 __all__ = [
+    "LazyRichGroup",
     "ProgressReporter",
     "RichCommand",
     "RichGroup",
     "confirm_action",
-    "console",
-    "error_console",
+    "get_console",
+    "get_error_console",
+    "get_success_console",
     "handle_keyboard_interrupt",
     "print_debug",
     "print_error",
@@ -31,7 +41,6 @@ __all__ = [
     "print_success",
     "print_warning",
     "setup_logging",
-    "success_console",
 ]
 
 # Custom theme for Dagger CLI
@@ -46,21 +55,115 @@ Dagger_THEME = Theme(
     },
 )
 
-# Console instances for different output types
-console = Console(theme=Dagger_THEME)
-error_console = Console(stderr=True, theme=Dagger_THEME, style="error")
-success_console = Console(theme=Dagger_THEME, style="success")
+
+# Message prefixes for the print_* helpers
+_INFO_PREFIX = "ℹ️ "  # noqa: RUF001
+_WARNING_PREFIX = "⚠️ "
+_ERROR_PREFIX = "❌ "
+_SUCCESS_PREFIX = "✅ "
+_DEBUG_PREFIX = "🐛 "
+
+# Responses accepted as confirmation by confirm_action
+_YES = frozenset(("y", "yes", "true", "1"))
+
+
+# Console instances for different output types are created on first use, so
+# importing this module does not probe the terminal.
+@cache
+def get_console() -> Console:
+    """Return the process-wide console shared by all CLI modules."""
+    return Console(theme=Dagger_THEME)
+
+
+@cache
+def get_error_console() -> Console:
+    """Return the process-wide console for error output."""
+    return Console(stderr=True, theme=Dagger_THEME, style="error")
+
+
+@cache
+def get_success_console() -> Console:
+    """Return the process-wide console for success output."""
+    return Console(theme=Dagger_THEME, style="success")
+
+
+_LAZY_CONSOLES = {
+    "console": get_console,
+    "error_console": get_error_console,
+    "success_console": get_success_console,
+}
+
+
+def __getattr__(name: str) -> Console:
+    """Create the module-level console instances on first access."""
+    try:
+        factory = _LAZY_CONSOLES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+    return factory()
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """Queue handler that passes records to the listener unformatted."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Return a shallow copy of the record for the queue.
+
+        The base implementation formats ``exc_info`` into the message and
+        clears it, which would stop ``RichHandler`` from rendering its own
+        tracebacks. The queue never leaves this process, so the record can be
+        passed on as it is.
+
+        Args:
+            record: Log record emitted by the calling thread
+
+        Returns:
+            Copy of the record to put on the queue
+
+        """
+        return copy.copy(record)
+
+
+# Background listener that renders queued log records with Rich, and the
+# root-logger handler that feeds it
+_log_listener: QueueListener | None = None
+_log_handler: QueueHandler | None = None
+
+# (verbose, quiet) arguments of the last setup_logging call
+_logging_configured: tuple[int, bool] | None = None
+
+
+def _stop_log_listener() -> None:
+    """Drain queued log records and stop the background listener."""
+    global _log_listener  # noqa: PLW0603
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
 
 
 def setup_logging(verbose: int = 0, quiet: bool = False) -> None:  # noqa: FBT001, FBT002
     """
     Setup logging configuration based on verbosity level.
 
+    The handler is installed on the root logger, so third-party loggers
+    (sqlalchemy, duckdb, ...) are rendered alongside Dagger's own. Log records
+    are put on a queue by the calling thread and rendered by a background
+    ``QueueListener``, so Rich formatting and console I/O stay off the
+    caller's path. Repeated calls with the same arguments are no-ops, and a
+    reconfiguration replaces the previous handler instead of stacking a
+    second one.
+
     Args:
         verbose: Verbosity level (0=INFO, 1=DEBUG, 2+=TRACE)
         quiet: If True, suppress all output except errors
 
     """
+    global _log_handler, _log_listener, _logging_configured  # noqa: PLW0603
+    if _logging_configured == (verbose, quiet):
+        return
+
     if quiet:
         log_level = logging.ERROR
     elif verbose == 0:
@@ -72,49 +175,64 @@ def setup_logging(verbose: int = 0, quiet: bool = False) -> None:  # noqa: FBT00
 
     # Configure rich handler
     rich_handler = RichHandler(
-        console=console,
+        console=get_console(),
         show_time=verbose > 1,
         show_path=verbose > 1,
         markup=True,
         rich_tracebacks=True,
     )
+    rich_handler.setFormatter(logging.Formatter("%(message)s", datefmt="[%X]"))
 
-    # Configure logging
-    logging.basicConfig(
-        level=log_level,
-        format="%(message)s",
-        datefmt="[%X]",
-        handlers=[rich_handler],
-    )
+    # Hand records to a background thread that owns the rich handler
+    if _log_listener is None:
+        atexit.register(_stop_log_listener)
+    else:
+        _log_listener.stop()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, rich_handler)
+    _log_listener.start()
+
+    # Configure the root logger, replacing the handler from a previous call
+    root_logger = logging.getLogger()
+    if _log_handler is not None:
+        root_logger.removeHandler(_log_handler)
+    _log_handler = _InProcessQueueHandler(log_queue)
+    root_logger.addHandler(_log_handler)
+    root_logger.setLevel(log_level)
 
     # Set logger for our package
-    logger = logging.getLogger("Dagger")
-    logger.setLevel(log_level)
+    logging.getLogger("Dagger").setLevel(log_level)
+
+    _logging_configured = (verbose, quiet)
 
 
 def print_info(message: str, **kwargs: dict[str, Any]) -> None:
     """Print an info message."""
-    console.print(f"ℹ️ {message}", style="info", **kwargs)  # noqa: RUF001
+    get_console().print(f"{_INFO_PREFIX}{message}", style="info", **kwargs)
 
 
 def print_warning(message: str, **kwargs: dict[str, Any]) -> None:
     """Print a warning message."""
-    console.print(f"⚠️ {message}", style="warning", **kwargs)
+    get_console().print(f"{_WARNING_PREFIX}{message}", style="warning", **kwargs)
 
 
 def print_error(message: str, **kwargs: dict[str, Any]) -> None:
     """Print an error message."""
-    error_console.print(f"❌ {message}", style="error", **kwargs)
+    get_error_console().print(f"{_ERROR_PREFIX}{message}", style="error", **kwargs)
 
 
 def print_success(message: str, **kwargs: dict[str, Any]) -> None:
     """Print a success message."""
-    success_console.print(f"✅ {message}", style="success", **kwargs)
+    get_success_console().print(
+        f"{_SUCCESS_PREFIX}{message}",
+        style="success",
+        **kwargs,
+    )
 
 
 def print_debug(message: str, **kwargs: dict[str, Any]) -> None:
     """Print a debug message."""
-    console.print(f"🐛 {message}", style="debug", **kwargs)
+    get_console().print(f"{_DEBUG_PREFIX}{message}", style="debug", **kwargs)
 
 
 def confirm_action(message: str, *, default: bool = False) -> bool:
@@ -130,12 +248,22 @@ def confirm_action(message: str, *, default: bool = False) -> bool:
 
     """
     default_str = "Y/n" if default else "y/N"
-    response = console.input(f"❓ {message} [{default_str}]: ").strip().lower()
+    prompt = f"❓ {message} [{default_str}]: "
 
+    console = get_console()
+    if console.is_terminal:
+        response = console.input(prompt)
+    else:
+        # Piped/scripted input: skip Rich's prompt machinery
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        response = sys.stdin.readline()
+
+    response = response.strip().lower()
     if not response:
         return default
 
-    return response in ("y", "yes", "true", "1")
+    return response in _YES
 
 
 def handle_keyboard_interrupt() -> None:
@@ -144,23 +272,59 @@ def handle_keyboard_interrupt() -> None:
     sys.exit(130)  # Standard exit code for SIGINT
 
 
+@cache
+def _progress_parts() -> tuple[type, type, tuple[Any, ...]]:
+    """
+    Import Rich's progress classes and build the shared columns once.
+
+    The text and elapsed-time columns keep no per-display state, so one pair
+    is reused by every reporter; spinners animate from their own start time
+    and are created per reporter.
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
+    columns = (
+        TextColumn("[progress.description]{task.description}"),
+        TimeElapsedColumn(),
+    )
+    return Progress, SpinnerColumn, columns
+
+
 class ProgressReporter:
     """Context manager for reporting progress of long-running operations."""
 
-    def __init__(self, description: str, console: Console | None = None) -> None:
+    __slots__ = (
+        "_last_update",
+        "_min_interval",
+        "_pending_description",
+        "console",
+        "description",
+        "progress",
+        "task",
+    )
+
+    def __init__(
+        self,
+        description: str,
+        console: Console | None = None,
+        min_interval: float = 0.1,
+    ) -> None:
         self.description = description
-        self.console = console or globals()["console"]
+        self.console = console or get_console()
         self.progress = None
         self.task = None
+        self._min_interval = min_interval
+        self._last_update = 0.0
+        self._pending_description: str | None = None
 
     def __enter__(self) -> Self:
-        from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+        progress_cls, spinner_column, columns = _progress_parts()
 
-        self.progress = Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            TimeElapsedColumn(),
+        self.progress = progress_cls(
+            spinner_column(),
+            *columns,
             console=self.console,
+            refresh_per_second=10,
         )
         self.progress.start()
         self.task = self.progress.add_task(self.description, total=None)
@@ -173,12 +337,31 @@ class ProgressReporter:
         exc_tb: types.TracebackType | None,
     ) -> None:
         if self.progress:
+            self._flush()
             self.progress.stop()
 
     def update(self, description: str) -> None:
-        """Update the progress description."""
-        if self.progress and self.task is not None:
-            self.progress.update(self.task, description=description)
+        """
+        Update the progress description.
+
+        Updates arriving faster than ``min_interval`` seconds apart are
+        coalesced; the latest description is always shown on exit.
+        """
+        self._pending_description = description
+        now = time.monotonic()
+        if now - self._last_update >= self._min_interval:
+            self._last_update = now
+            self._flush()
+
+    def _flush(self) -> None:
+        """Forward the pending description to the progress display."""
+        if (
+            self.progress
+            and self.task is not None
+            and self._pending_description is not None
+        ):
+            self.progress.update(self.task, description=self._pending_description)
+            self._pending_description = None
 
 
 class RichGroup(click.Group):
@@ -193,48 +376,105 @@ class RichGroup(click.Group):
         """Format the help page using Rich instead of Click's default formatter."""
         help_text = self.get_short_help_str()
 
-        # Create Rich text object for the help content
-        help_content = Text()
+        # Build the help content as markup and parse it once
+        parts: list[str] = []
 
         # Add command name and description
         if self.name:
-            help_content.append(f"{self.name}\n", style="bold blue")
+            parts.append(f"[bold blue]{escape(self.name)}[/bold blue]\n")
 
         if help_text:
-            help_content.append(f"{help_text}\n\n", style="")
+            parts.append(f"{escape(help_text)}\n\n")
 
         # Add usage section
         usage = self.get_usage(ctx)
         if usage:
-            help_content.append("Usage:\n", style="bold yellow")
-            help_content.append(f"  {usage}\n\n", style="dim")
+            parts.append(
+                f"[bold yellow]Usage:[/bold yellow]\n[dim]  {escape(usage)}[/dim]\n\n"
+            )
 
         # Add options section
         if self.params:
-            help_content.append("Options:\n", style="bold yellow")
-            for param in self.params:
-                if isinstance(param, click.Option):
-                    opts = "/".join(param.opts)
-                    help_line = f"  {opts:20} {param.help or ''}\n"
-                    help_content.append(help_line, style="")
-            help_content.append("\n")
+            parts.append("[bold yellow]Options:[/bold yellow]\n")
+            parts.extend(
+                escape(f"  {'/'.join(param.opts):20} {param.help or ''}\n")
+                for param in self.params
+                if isinstance(param, click.Option)
+            )
+            parts.append("\n")
 
         # Add commands section
-        if hasattr(self, "commands") and self.commands:
-            help_content.append("Commands:\n", style="bold yellow")
-            for name, cmd in self.commands.items():
-                cmd_help = cmd.get_short_help_str() or ""
-                help_line = f"  {name:20} {cmd_help}\n"
-                help_content.append(help_line, style="")
+        command_help = self.get_command_short_help(ctx)
+        if command_help:
+            parts.append("[bold yellow]Commands:[/bold yellow]\n")
+            parts.extend(
+                escape(f"  {name:20} {cmd_help}\n")
+                for name, cmd_help in command_help.items()
+            )
 
         # Display the formatted help
         panel = Panel(
-            help_content,
+            Text.from_markup("".join(parts)),
             title="Dagger CLI Help",
             border_style="blue",
             padding=(1, 2),
         )
-        console.print(panel)
+        get_console().print(panel)
+
+    def get_command_short_help(self, ctx: click.Context) -> dict[str, str]:  # noqa: ARG002
+        """Return the short help string for each registered subcommand."""
+        return {
+            name: cmd.get_short_help_str() or "" for name, cmd in self.commands.items()
+        }
+
+
+class LazyRichGroup(RichGroup):
+    """
+    RichGroup that imports its subcommands only when they are invoked.
+
+    Subcommands are declared as ``name -> (import_path, short_help)`` where
+    ``import_path`` has the form ``"package.module:attribute"``. Click asks for
+    a command by name only when it is about to run it, so an invocation pays
+    the import cost of a single subcommand module. Group-level help is built
+    from the static short help strings without importing anything.
+    """
+
+    def __init__(
+        self,
+        *args: Any,  # noqa: ANN401
+        lazy_subcommands: dict[str, tuple[str, str]] | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eagerly registered and lazy subcommand names."""
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Get a subcommand, importing it on first request."""
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            self.add_command(self._load_command(cmd_name), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def get_command_short_help(self, ctx: click.Context) -> dict[str, str]:
+        """Return short help strings without importing lazy subcommands."""
+        command_help = {
+            name: short_help for name, (_, short_help) in self.lazy_subcommands.items()
+        }
+        command_help.update(super().get_command_short_help(ctx))
+        return dict(sorted(command_help.items()))
+
+    def _load_command(self, cmd_name: str) -> click.Command:
+        """Import the module backing a lazy subcommand and return the command."""
+        import_path, _ = self.lazy_subcommands[cmd_name]
+        module_name, attribute = import_path.split(":", 1)
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            msg = f"Lazy subcommand {cmd_name!r} did not resolve to a Click command"
+            raise TypeError(msg)
+        return command
 
 
 class RichCommand(click.Command):
@@ -245,16 +485,16 @@ class RichCommand(click.Command):
     for enhanced terminal output.
     """
 
-    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:  # noqa: ARG002, C901, PLR0912
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:  # noqa: ARG002
         """Format the help page using Rich instead of Click's default formatter."""
         help_text = self.help or "No help available."
 
-        # Create Rich text object for the help content
-        help_content = Text()
+        # Build the help content as markup and parse it once
+        parts: list[str] = []
 
         # Add command name and description
         if self.name:
-            help_content.append(f"{self.name}\n", style="bold blue")
+            parts.append(f"[bold blue]{escape(self.name)}[/bold blue]\n")
 
         # Process help text to separate main description from examples
         lines = help_text.split("\n")
@@ -273,13 +513,14 @@ class RichCommand(click.Command):
         # Add main help text
         main_help_text = "\n".join(main_help).strip()
         if main_help_text:
-            help_content.append(f"{main_help_text}\n\n", style="")
+            parts.append(f"{escape(main_help_text)}\n\n")
 
         # Add usage section
         usage = self.get_usage(ctx)
         if usage:
-            help_content.append("Usage:\n", style="bold yellow")
-            help_content.append(f"  {usage}\n\n", style="dim")
+            parts.append(
+                f"[bold yellow]Usage:[/bold yellow]\n[dim]  {escape(usage)}[/dim]\n\n"
+            )
 
         # Separate arguments and options
         arguments = [p for p in self.params if isinstance(p, click.Argument)]
@@ -287,40 +528,40 @@ class RichCommand(click.Command):
 
         # Add arguments section
         if arguments:
-            help_content.append("Arguments:\n", style="bold yellow")
-            for param in arguments:
-                arg_name = param.name.upper()
-                arg_desc = f"{param.name} argument"
-                if param.required:
-                    arg_desc += " (required)"
-                help_line = f"  {arg_name:20} {arg_desc}\n"
-                help_content.append(help_line, style="")
-            help_content.append("\n")
+            parts.append("[bold yellow]Arguments:[/bold yellow]\n")
+            parts.extend(
+                escape(
+                    f"  {param.name.upper():20} {param.name} argument"
+                    f"{' (required)' if param.required else ''}\n",
+                )
+                for param in arguments
+            )
+            parts.append("\n")
 
         # Add options section
         if options:
-            help_content.append("Options:\n", style="bold yellow")
-            for param in options:
-                opts = "/".join(param.opts)
-                help_line = f"  {opts:20} {param.help or ''}\n"
-                help_content.append(help_line, style="")
-            help_content.append("\n")
+            parts.append("[bold yellow]Options:[/bold yellow]\n")
+            parts.extend(
+                escape(f"  {'/'.join(param.opts):20} {param.help or ''}\n")
+                for param in options
+            )
+            parts.append("\n")
 
         # Add examples section if present
         if examples:
-            help_content.append("Examples:\n", style="bold yellow")
-            for example in examples:
-                if example.strip():
-                    if example.strip().startswith("#"):
-                        help_content.append(f"  {example}\n", style="dim cyan")
-                    else:
-                        help_content.append(f"  {example}\n", style="dim")
+            parts.append("[bold yellow]Examples:[/bold yellow]\n")
+            parts.extend(
+                f"[{'dim cyan' if example.strip().startswith('#') else 'dim'}]"
+                f"  {escape(example)}[/]\n"
+                for example in examples
+                if example.strip()
+            )
 
         # Display the formatted help
         panel = Panel(
-            help_content,
+            Text.from_markup("".join(parts)),
             title=f"Dagger - {self.name}",
             border_style="blue",
             padding=(1, 2),
         )
-        console.print(panel)
+        get_console().print(panel)
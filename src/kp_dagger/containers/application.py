@@ -28,7 +28,6 @@ class ApplicationContainer(containers.DeclarativeContainer):
     parser_container = providers.Container(
         ParserContainer,
         config=config.parsers,
-        database_manager=core_container.database_manager,
     )
 
     analyzer_container = providers.Container(
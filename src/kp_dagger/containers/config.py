@@ -1,11 +1,15 @@
 """Configuration management for dependency injection."""
 
+import copy
+from functools import cache
 from pathlib import Path
 from typing import Any
 
-import yaml
 from pydantic import BaseModel, Field
 
+# Parsed YAML configuration keyed by (resolved path, st_mtime_ns, st_size)
+_YAML_CACHE: dict[tuple[str, int, int], dict[str, Any]] = {}
+
 
 class DatabaseConfig(BaseModel):
     """Database configuration."""
@@ -134,10 +138,25 @@ class DaggerConfig(BaseModel):
     scanner: ScannerConfig = Field(default_factory=ScannerConfig)
 
 
+@cache
+def _yaml_loader() -> type:
+    """Return PyYAML's C safe loader, falling back to the pure-Python one."""
+    try:
+        from yaml import CSafeLoader
+    except ImportError:
+        from yaml import SafeLoader
+
+        return SafeLoader
+    return CSafeLoader
+
+
 def load_config(config_path: str | Path) -> dict[str, Any]:
     """
     Load configuration from YAML file.
 
+    The parsed file is cached per path and reused for as long as the file's
+    modification time and size are unchanged. Each call returns its own copy.
+
     Args:
         config_path: Path to configuration file
 
@@ -145,14 +164,23 @@ def load_config(config_path: str | Path) -> dict[str, Any]:
         Configuration dictionary
 
     """
-    config_file = Path(config_path)
+    config_file = Path(config_path).resolve()
 
-    if not config_file.exists():
+    try:
+        stat = config_file.stat()
+    except FileNotFoundError:
         msg = f"Configuration file not found: {config_path}"
-        raise FileNotFoundError(msg)
+        raise FileNotFoundError(msg) from None
+
+    cache_key = (str(config_file), stat.st_mtime_ns, stat.st_size)
+    config_dict = _YAML_CACHE.get(cache_key)
+    if config_dict is None:
+        import yaml
+
+        config_dict = yaml.load(config_file.read_bytes(), Loader=_yaml_loader())  # noqa: S506
+        _YAML_CACHE[cache_key] = config_dict
 
-    with config_file.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    return copy.deepcopy(config_dict)
 
 
 def validate_config(config_dict: dict[str, Any]) -> DaggerConfig:
@@ -10,11 +10,7 @@ class ParserContainer(containers.DeclarativeContainer):
 
     config = providers.Configuration()
 
-    # External dependencies
-    database_manager = providers.Dependency()
-
     # Parser services
     parser_factory: providers.Singleton[ParserFactory] = providers.Singleton(
         ParserFactory,
-        database_manager=database_manager,
     )
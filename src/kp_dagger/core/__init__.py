@@ -4,3 +4,42 @@ Core functionality for Dagger.
 This module provides core services including encryption, database management,
 and other foundational components.
 """
+
+# Re-exports are resolved on first access so that ``import kp_dagger.core`` does
+# not import the scanner's database, parser, and DI dependency graph.
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    "DaggerScanner": ("kp_dagger.core.scanner", "DaggerScanner"),
+    "NetworkScanner": ("kp_dagger.core.scanner", "NetworkScanner"),
+    "Scanner": ("kp_dagger.core.scanner", "Scanner"),
+    "Database": ("kp_dagger.core.database", "Database"),
+    "DatabaseManager": ("kp_dagger.core.database", "DatabaseManager"),
+    "DaggerError": ("kp_dagger.core.exceptions", "DaggerError"),
+    "NetworkScannerError": ("kp_dagger.core.exceptions", "NetworkScannerError"),
+    "UnsupportedDeviceError": ("kp_dagger.core.exceptions", "UnsupportedDeviceError"),
+}
+
+__all__ = [
+    "DaggerError",
+    "DaggerScanner",
+    "Database",
+    "DatabaseManager",
+    "NetworkScanner",
+    "NetworkScannerError",
+    "Scanner",
+    "UnsupportedDeviceError",
+]
+
+
+def __getattr__(name: str) -> object:
+    """Lazily import core services on first attribute access (PEP 562)."""
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), attribute)
+    globals()[name] = value
+    return value
@@ -33,7 +33,10 @@ class DatabaseManager:
         self._is_initialized = False
 
     def initialize(self) -> None:
-        """Initialize the database and create tables."""
+        """Initialize the database and create tables; later calls are no-ops."""
+        if self._is_initialized:
+            return
+
         try:
             # Create DuckDB connection
             if self.database_path == ":memory:":
@@ -2,18 +2,26 @@
 Core encryption service for Dagger.
 
 Provides field-level encryption using AES256-GCM with tenant-specific
-key derivation using Argon2id KDF. All encryption is performed with
-authenticated encryption to ensure data integrity.
+key derivation. A tenant master key is derived once with the Argon2id KDF
+and per-field keys are expanded from it with HKDF-SHA256. All encryption is
+performed with authenticated encryption to ensure data integrity.
 """
 
+import hashlib
 import os
 import secrets
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
 from uuid import UUID
 
+from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.kdf.scrypt import Scrypt
 
 try:
     from argon2 import PasswordHasher
@@ -26,7 +34,17 @@ except ImportError:
 # Constants
 MIN_RUNTIME_KEY_LENGTH = 32
 PBKDF2_ITERATIONS = 600000
+SCRYPT_N = 2**15
+SCRYPT_R = 8
+SCRYPT_P = 1
 GCM_NONCE_LENGTH = 12
+CIPHERTEXT_VERSION = 1
+KEY_CACHE_SIZE = 256
+SALT_ROTATION_INTERVAL = 2**20
+MASTER_KEY_INFO = b"dagger-master"
+FIELD_KEY_INFO = b"dagger-field"
+
+_VERSION_PREFIX = bytes((CIPHERTEXT_VERSION,))
 
 
 class EncryptionError(Exception):
@@ -44,6 +62,15 @@ class DecryptionError(EncryptionError):
 class KDFConfig:
     """Configuration for key derivation functions."""
 
+    __slots__ = (
+        "algorithm",
+        "key_length",
+        "memory_cost",
+        "parallelism",
+        "salt_length",
+        "time_cost",
+    )
+
     def __init__(  # noqa: PLR0913
         self,
         algorithm: str = "argon2id",
@@ -57,7 +84,8 @@ class KDFConfig:
         Initialize KDF configuration.
 
         Args:
-            algorithm: KDF algorithm ("argon2id" or "pbkdf2")
+            algorithm: KDF algorithm ("argon2id", "scrypt", "pbkdf2" or "hkdf";
+                "hkdf" suits runtime keys that are already random key material)
             time_cost: Time cost parameter for Argon2
             memory_cost: Memory cost parameter for Argon2 (in KB)
             parallelism: Parallelism parameter for Argon2
@@ -85,6 +113,17 @@ class TenantEncryptionService:
     tenant isolation through tenant-specific key derivation.
     """
 
+    __slots__ = (
+        "_cipher_cache",
+        "_lock",
+        "_master_key",
+        "_write_salt",
+        "_write_salt_uses",
+        "kdf_config",
+        "runtime_key",
+        "tenant_id",
+    )
+
     def __init__(
         self,
         tenant_id: UUID,
@@ -103,20 +142,43 @@ class TenantEncryptionService:
         self.tenant_id = tenant_id
         self.runtime_key = runtime_key
         self.kdf_config = kdf_config or KDFConfig()
+        self._master_key: bytes | None = None
+        self._cipher_cache: OrderedDict[bytes, AESGCM] = OrderedDict()
+        self._write_salt: bytes | None = None
+        self._write_salt_uses = 0
+        self._lock = threading.Lock()
 
         if len(runtime_key) < MIN_RUNTIME_KEY_LENGTH:
             msg = f"Runtime key must be at least {MIN_RUNTIME_KEY_LENGTH} bytes"
             raise EncryptionConfigError(msg)
 
-    def _derive_key(self, salt: bytes) -> bytes:
+    def _get_master_key(self) -> bytes:
+        """
+        Return the tenant master key, deriving it on first use.
+
+        The master key is derived once per service with the configured KDF,
+        using a tenant-constant salt.
+
+        Returns:
+            Tenant master key
+
+        """
+        if self._master_key is not None:
+            return self._master_key
+
+        salt = hashlib.sha256(str(self.tenant_id).encode()).digest()
+        self._master_key = self._run_kdf(salt)
+        return self._master_key
+
+    def _run_kdf(self, salt: bytes) -> bytes:
         """
-        Derive encryption key using configured KDF.
+        Run the configured KDF over the tenant key material.
 
         Args:
             salt: Salt for key derivation
 
         Returns:
-            Derived encryption key
+            Derived key
 
         """
         # Combine tenant ID and runtime key for key material
@@ -124,12 +186,64 @@ class TenantEncryptionService:
 
         if self.kdf_config.algorithm == "argon2id":
             return self._derive_key_argon2(key_material, salt)
+        if self.kdf_config.algorithm == "scrypt":
+            return self._derive_key_scrypt(key_material, salt)
         if self.kdf_config.algorithm == "pbkdf2":
             return self._derive_key_pbkdf2(key_material, salt)
+        if self.kdf_config.algorithm == "hkdf":
+            return self._derive_key_hkdf(key_material, salt)
 
         msg = f"Unsupported KDF: {self.kdf_config.algorithm}"
         raise EncryptionConfigError(msg)
 
+    def _derive_key(self, salt: bytes) -> bytes:
+        """
+        Derive a per-field encryption key from the tenant master key.
+
+        Uses HKDF-SHA256 with the per-record salt.
+
+        Args:
+            salt: Salt for key derivation
+
+        Returns:
+            Derived encryption key
+
+        """
+        return HKDF(
+            algorithm=hashes.SHA256(),
+            length=self.kdf_config.key_length,
+            salt=salt,
+            info=FIELD_KEY_INFO,
+        ).derive(self._get_master_key())
+
+    def _get_cipher(self, salt: bytes) -> AESGCM:
+        """
+        Return the AES-GCM cipher for a salt, building it on first use.
+
+        Ciphers are kept in a small LRU cache keyed by salt, so records sharing
+        a salt reuse both the derived key and the initialized cipher. The
+        cache is guarded by the service lock, as services are shared between
+        threads.
+
+        Args:
+            salt: Salt for key derivation
+
+        Returns:
+            AES-GCM cipher keyed for the salt
+
+        """
+        with self._lock:
+            cipher = self._cipher_cache.get(salt)
+            if cipher is not None:
+                self._cipher_cache.move_to_end(salt)
+                return cipher
+
+            cipher = AESGCM(self._derive_key(salt))
+            self._cipher_cache[salt] = cipher
+            if len(self._cipher_cache) > KEY_CACHE_SIZE:
+                self._cipher_cache.popitem(last=False)
+            return cipher
+
     def _derive_key_argon2(self, key_material: bytes, salt: bytes) -> bytes:
         """Derive key using Argon2id."""
         return hash_secret_raw(
@@ -142,8 +256,19 @@ class TenantEncryptionService:
             type=Type.ID,
         )
 
+    def _derive_key_scrypt(self, key_material: bytes, salt: bytes) -> bytes:
+        """Derive key using scrypt (memory-hard fallback when Argon2 unavailable)."""
+        kdf = Scrypt(
+            salt=salt,
+            length=self.kdf_config.key_length,
+            n=SCRYPT_N,
+            r=SCRYPT_R,
+            p=SCRYPT_P,
+        )
+        return kdf.derive(key_material)
+
     def _derive_key_pbkdf2(self, key_material: bytes, salt: bytes) -> bytes:
-        """Derive key using PBKDF2 (fallback when Argon2 unavailable)."""
+        """Derive key using PBKDF2 (for environments without scrypt support)."""
         kdf = PBKDF2HMAC(
             algorithm=hashes.SHA256(),
             length=self.kdf_config.key_length,
@@ -153,6 +278,47 @@ class TenantEncryptionService:
         )
         return kdf.derive(key_material)
 
+    def _derive_key_hkdf(self, key_material: bytes, salt: bytes) -> bytes:
+        """
+        Derive key using HKDF-SHA256.
+
+        Only suitable when the runtime key is random key material rather than
+        a password; no work factor is applied.
+        """
+        return HKDF(
+            algorithm=hashes.SHA256(),
+            length=self.kdf_config.key_length,
+            salt=salt,
+            info=MASTER_KEY_INFO,
+        ).derive(key_material)
+
+    def _next_write_salt(self, count: int = 1) -> bytes:
+        """
+        Return the salt for the next ``count`` encryptions.
+
+        Encryptions share one salt, and therefore one cached AES-GCM cipher,
+        until ``SALT_ROTATION_INTERVAL`` values have been written under it.
+        Every value still gets its own random nonce, and rotating the salt
+        keeps the number of random nonces per key far below the AES-GCM
+        limit.
+
+        Args:
+            count: Number of values about to be encrypted
+
+        Returns:
+            Salt to encrypt the values with
+
+        """
+        with self._lock:
+            if (
+                self._write_salt is None
+                or self._write_salt_uses + count > SALT_ROTATION_INTERVAL
+            ):
+                self._write_salt = os.urandom(self.kdf_config.salt_length)
+                self._write_salt_uses = 0
+            self._write_salt_uses += count
+            return self._write_salt
+
     def encrypt(self, plaintext: str) -> bytes:
         """
         Encrypt plaintext string.
@@ -161,30 +327,66 @@ class TenantEncryptionService:
             plaintext: String to encrypt
 
         Returns:
-            Encrypted data (salt + nonce + ciphertext + tag)
+            Encrypted data (version + salt + nonce + ciphertext + tag)
 
         """
         if not plaintext:
             return b""
 
-        # Generate salt and nonce
-        salt = os.urandom(self.kdf_config.salt_length)
+        salt = self._next_write_salt()
         nonce = os.urandom(GCM_NONCE_LENGTH)
 
-        # Derive encryption key
-        key = self._derive_key(salt)
-
         # Encrypt with AES-GCM
-        aesgcm = AESGCM(key)
+        aesgcm = self._get_cipher(salt)
         ciphertext = aesgcm.encrypt(nonce, plaintext.encode("utf-8"), None)
 
-        # Return: salt + nonce + ciphertext (includes tag)
-        return salt + nonce + ciphertext
+        # Return: version + salt + nonce + ciphertext (includes tag)
+        return b"".join((_VERSION_PREFIX, salt, nonce, ciphertext))
+
+    def encrypt_many(self, plaintexts: Sequence[str]) -> list[bytes]:
+        """
+        Encrypt a batch of plaintext strings.
+
+        The batch shares one salt and cipher; every value still gets its own
+        random nonce, drawn from a single random read. Each
+        result has the same layout as ``encrypt()`` output and can be passed
+        to ``decrypt()``.
+
+        Args:
+            plaintexts: Strings to encrypt
+
+        Returns:
+            Encrypted data for each plaintext, in order (b"" for empty strings)
+
+        """
+        if not plaintexts:
+            return []
+
+        salt = self._next_write_salt(len(plaintexts))
+        random_bytes = os.urandom(GCM_NONCE_LENGTH * len(plaintexts))
+        aesgcm = self._get_cipher(salt)
+
+        results = []
+        offset = 0
+        for plaintext in plaintexts:
+            if not plaintext:
+                results.append(b"")
+                continue
+            nonce = random_bytes[offset : offset + GCM_NONCE_LENGTH]
+            offset += GCM_NONCE_LENGTH
+            ciphertext = aesgcm.encrypt(nonce, plaintext.encode("utf-8"), None)
+            results.append(b"".join((_VERSION_PREFIX, salt, nonce, ciphertext)))
+        return results
 
     def decrypt(self, encrypted_data: bytes) -> str:
         """
         Decrypt encrypted data.
 
+        Data without the version prefix was written before the tenant master
+        key existed, with the KDF run directly on each record salt; it is
+        still decrypted that way. Legacy data whose random salt happens to
+        start with the version byte is retried the same way.
+
         Args:
             encrypted_data: Encrypted data from encrypt()
 
@@ -196,29 +398,43 @@ class TenantEncryptionService:
             return ""
 
         try:
-            # Extract components
-            salt_len = self.kdf_config.salt_length
-            salt = encrypted_data[:salt_len]
-            nonce = encrypted_data[salt_len : salt_len + GCM_NONCE_LENGTH]
-            ciphertext = encrypted_data[salt_len + GCM_NONCE_LENGTH :]
-
-            # Derive decryption key
-            key = self._derive_key(salt)
+            data = memoryview(encrypted_data)
+            if data[0] == CIPHERTEXT_VERSION:
+                try:
+                    return self._decrypt_payload(data[1:], self._get_cipher)
+                except InvalidTag:
+                    pass
 
-            # Decrypt with AES-GCM
-            aesgcm = AESGCM(key)
-            plaintext_bytes = aesgcm.decrypt(nonce, ciphertext, None)
-
-            return plaintext_bytes.decode("utf-8")
+            return self._decrypt_payload(data, self._get_legacy_cipher)
 
         except Exception as e:
             msg = f"Failed to decrypt data: {e}"
             raise DecryptionError(msg) from e
 
+    def _decrypt_payload(
+        self,
+        data: memoryview,
+        get_cipher: Callable[[bytes], AESGCM],
+    ) -> str:
+        """Split salt + nonce + ciphertext and decrypt with the salt's cipher."""
+        salt_len = self.kdf_config.salt_length
+        salt = bytes(data[:salt_len])
+        nonce = data[salt_len : salt_len + GCM_NONCE_LENGTH]
+        ciphertext = data[salt_len + GCM_NONCE_LENGTH :]
+
+        plaintext_bytes = get_cipher(salt).decrypt(nonce, ciphertext, None)
+        return plaintext_bytes.decode("utf-8")
+
+    def _get_legacy_cipher(self, salt: bytes) -> AESGCM:
+        """Return the cipher for unversioned data, keyed by the KDF on its salt."""
+        return AESGCM(self._run_kdf(salt))
+
 
 class EncryptionServiceManager:
     """Manages encryption services for multiple tenants."""
 
+    __slots__ = ("_services", "kdf_config", "runtime_key")
+
     def __init__(self, runtime_key: bytes, kdf_config: KDFConfig | None = None) -> None:
         """
         Initialize the encryption service manager.
@@ -234,13 +450,18 @@ class EncryptionServiceManager:
 
     def get_service(self, tenant_id: UUID) -> TenantEncryptionService:
         """Get or create encryption service for tenant."""
-        if tenant_id not in self._services:
-            self._services[tenant_id] = TenantEncryptionService(
-                tenant_id=tenant_id,
-                runtime_key=self.runtime_key,
-                kdf_config=self.kdf_config,
+        service = self._services.get(tenant_id)
+        if service is None:
+            # setdefault is atomic, so concurrent callers share one instance
+            service = self._services.setdefault(
+                tenant_id,
+                TenantEncryptionService(
+                    tenant_id=tenant_id,
+                    runtime_key=self.runtime_key,
+                    kdf_config=self.kdf_config,
+                ),
             )
-        return self._services[tenant_id]
+        return service
 
     @classmethod
     def generate_runtime_key(cls) -> bytes:
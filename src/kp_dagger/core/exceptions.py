@@ -1,14 +1,21 @@
 """Core exceptions for Dagger."""
 
+from collections.abc import Mapping
+from functools import lru_cache
+from types import MappingProxyType
+
+# Shared read-only details for exceptions raised without any
+_EMPTY_DETAILS: Mapping[str, str] = MappingProxyType({})
+
 
 class DaggerError(Exception):
     """Base exception for network scanner errors."""
 
-    def __init__(self, message: str, details: dict[str, str] | None = None) -> None:
+    def __init__(self, message: str, details: Mapping[str, str] | None = None) -> None:
         """Initialize the exception."""
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        self.details = details if details is not None else _EMPTY_DETAILS
 
 
 class ConfigurationError(DaggerError):
@@ -23,7 +30,7 @@ class ParsingError(DaggerError):
         message: str,
         device_type: str | None = None,
         line_number: int | None = None,
-        details: dict[str, str] | None = None,
+        details: Mapping[str, str] | None = None,
     ) -> None:
         """Initialize the parsing error."""
         super().__init__(message, details)
@@ -43,7 +50,7 @@ class ValidationError(DaggerError):
         message: str,
         field: str | None = None,
         value: str | None = None,
-        details: dict[str, str] | None = None,
+        details: Mapping[str, str] | None = None,
     ) -> None:
         """Initialize the validation error."""
         super().__init__(message, details)
@@ -59,21 +66,30 @@ class ReportError(DaggerError):
     """Report generation errors."""
 
 
+@lru_cache(maxsize=32)
+def _format_supported_types(supported_types: tuple[str, ...]) -> str:
+    """Return the message suffix listing supported device types."""
+    if not supported_types:
+        return ""
+    return f". Supported types: {', '.join(supported_types)}"
+
+
 class UnsupportedDeviceError(DaggerError):
     """Unsupported device type errors."""
 
     def __init__(
         self,
         device_type: str,
-        supported_types: list[str] | None = None,
+        supported_types: tuple[str, ...] | list[str] | None = None,
     ) -> None:
         """Initialize the unsupported device error."""
-        message = f"Unsupported device type: {device_type}"
-        if supported_types:
-            message += f". Supported types: {', '.join(supported_types)}"
-        super().__init__(message)
+        supported = tuple(supported_types or ())
+        super().__init__(
+            f"Unsupported device type: {device_type}"
+            f"{_format_supported_types(supported)}",
+        )
         self.device_type = device_type
-        self.supported_types = supported_types or []
+        self.supported_types = list(supported)
 
 
 class APIError(DaggerError):
@@ -84,7 +100,7 @@ class APIError(DaggerError):
         message: str,
         api_name: str | None = None,
         status_code: int | None = None,
-        details: dict[str, str] | None = None,
+        details: Mapping[str, str] | None = None,
     ) -> None:
         """Initialize the API error."""
         super().__init__(message, details)
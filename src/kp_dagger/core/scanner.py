@@ -1,5 +1,10 @@
 """Core Dagger scanner implementation."""
 
+import re
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +18,45 @@ from kp_dagger.core.exceptions import (
 )
 from kp_dagger.models.base.enums import DeviceType, ReportFormat
 from kp_dagger.parsers.factory import ParserFactory
+from kp_dagger.reports.generator import ReportGenerator
+
+# Device type names listed when auto-detection fails
+_SUPPORTED_DEVICE_TYPES = tuple(t.value for t in DeviceType)
+
+# Severity levels reported in scan summaries, in ascending order
+_SEVERITY_LEVELS = ("low", "medium", "high", "critical")
+
+# Case-insensitive keyword patterns for device type auto-detection, checked
+# in order; each is compiled once so a check is a single regex pass
+_DEVICE_DETECTION_PATTERNS = tuple(
+    (device_type, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+    for device_type, keywords in (
+        (
+            DeviceType.CISCO_IOS,
+            (
+                "version ",
+                "hostname ",
+                "interface ",
+                "router ",
+                "access-list ",
+                "ip route",
+                "line vty",
+            ),
+        ),
+        (
+            DeviceType.CISCO_ASA,
+            ("asa version", "access-group", "object-group", "nat "),
+        ),
+        (
+            DeviceType.FORTIGATE,
+            ("config system", "config firewall", "edit ", "next", "end"),
+        ),
+        (
+            DeviceType.PALOALTO,
+            ("<config", "<entry name", "<member>", "</config>"),
+        ),
+    )
+)
 
 
 class DaggerScanner:
@@ -69,6 +113,93 @@ class DaggerScanner:
         Raises:
             NetworkScannerError: If scanning fails
 
+        """
+        device_type, parsed_config = self._parse_file(config_file, device_type)
+        return self._store_and_analyze(config_file, device_type, parsed_config)
+
+    def scan_files(
+        self,
+        config_files: Iterable[Path],
+        device_type: DeviceType | None = None,
+        jobs: int = 1,
+    ) -> list[dict[str, Any]]:
+        """
+        Scan several configuration files.
+
+        Args:
+            config_files: Paths to configuration files
+            device_type: Device type for every file (auto-detected if None)
+            jobs: Maximum number of files to parse concurrently
+
+        Returns:
+            Scan results for each file, in input order
+
+        Raises:
+            NetworkScannerError: If scanning any file fails
+
+        """
+        return list(self.iter_scan_files(config_files, device_type, jobs))
+
+    def iter_scan_files(
+        self,
+        config_files: Iterable[Path],
+        device_type: DeviceType | None = None,
+        jobs: int = 1,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Scan several configuration files, yielding each result when ready.
+
+        Results are produced in input order as soon as each file is done, so
+        callers can display or write them without holding the whole batch.
+        With ``jobs`` greater than one, files are read and parsed on a pool of
+        worker threads. Storage and analysis stay on the calling thread
+        because they share the database connection.
+
+        Args:
+            config_files: Paths to configuration files
+            device_type: Device type for every file (auto-detected if None)
+            jobs: Maximum number of files to parse concurrently
+
+        Yields:
+            Scan result for each file, in input order
+
+        Raises:
+            NetworkScannerError: If scanning any file fails
+
+        """
+        if jobs <= 1:
+            for config_file in config_files:
+                yield self.scan_file(config_file, device_type)
+            return
+
+        files = list(config_files)
+        parse = partial(self._parse_file, device_type=device_type)
+        with ThreadPoolExecutor(max_workers=min(jobs, len(files) or 1)) as pool:
+            for config_file, parsed in zip(
+                files,
+                pool.map(parse, files),
+                strict=True,
+            ):
+                yield self._store_and_analyze(config_file, *parsed)
+
+    def _parse_file(
+        self,
+        config_file: Path,
+        device_type: DeviceType | None = None,
+    ) -> tuple[DeviceType, dict[str, Any]]:
+        """
+        Read and parse a configuration file.
+
+        Args:
+            config_file: Path to configuration file
+            device_type: Device type (auto-detected if None)
+
+        Returns:
+            Device type and parsed configuration data
+
+        Raises:
+            NetworkScannerError: If reading or parsing fails
+
         """
         if not config_file.exists():
             msg = f"Configuration file not found: {config_file}"
@@ -86,8 +217,34 @@ class DaggerScanner:
             parser = self.parser_factory.get_parser(device_type)
 
             # Parse configuration
-            parsed_config = parser.parse(config_text)
+            return device_type, parser.parse(config_text)
+
+        except Exception as e:
+            msg = f"Failed to scan {config_file}: {e}"
+            raise NetworkScannerError(msg) from e
+
+    def _store_and_analyze(
+        self,
+        config_file: Path,
+        device_type: DeviceType,
+        parsed_config: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Store a parsed configuration and run security analysis on it.
+
+        Args:
+            config_file: Path to configuration file
+            device_type: Device type of the configuration
+            parsed_config: Parsed configuration data
+
+        Returns:
+            Dictionary containing scan results
+
+        Raises:
+            NetworkScannerError: If storage or analysis fails
 
+        """
+        try:
             # Store in database
             device_id = self.database.store_device_config(
                 device_type=device_type,
@@ -125,47 +282,12 @@ class DaggerScanner:
             UnsupportedDeviceError: If device type cannot be detected
 
         """
-        # Simple heuristic-based detection
-        config_lower = config_text.lower()
+        # Simple heuristic-based detection, checked in priority order
+        for device_type, pattern in _DEVICE_DETECTION_PATTERNS:
+            if pattern.search(config_text):
+                return device_type
 
-        # Check for Cisco IOS patterns
-        if any(
-            pattern in config_lower
-            for pattern in [
-                "version ",
-                "hostname ",
-                "interface ",
-                "router ",
-                "access-list ",
-                "ip route",
-                "line vty",
-            ]
-        ):
-            return DeviceType.CISCO_IOS
-
-        # Check for Cisco ASA patterns
-        if any(
-            pattern in config_lower
-            for pattern in ["asa version", "access-group", "object-group", "nat "]
-        ):
-            return DeviceType.CISCO_ASA
-
-        # Check for FortiGate patterns
-        if any(
-            pattern in config_lower
-            for pattern in ["config system", "config firewall", "edit ", "next", "end"]
-        ):
-            return DeviceType.FORTIGATE
-
-        # Check for PAN-OS patterns
-        if any(
-            pattern in config_lower
-            for pattern in ["<config", "<entry name", "<member>", "</config>"]
-        ):
-            return DeviceType.PALOALTO
-
-        supported_types = [t.value for t in DeviceType]
-        raise UnsupportedDeviceError("unknown", supported_types)
+        raise UnsupportedDeviceError("unknown", _SUPPORTED_DEVICE_TYPES)
 
     def _analyze_configuration(
         self,
@@ -217,14 +339,9 @@ class DaggerScanner:
             Dictionary with severity counts
 
         """
-        counts = {"low": 0, "medium": 0, "high": 0, "critical": 0}
+        counts = Counter(finding.get("severity", "low") for finding in findings)
 
-        for finding in findings:
-            severity = finding.get("severity", "low")
-            if severity in counts:
-                counts[severity] += 1
-
-        return counts
+        return {severity: counts[severity] for severity in _SEVERITY_LEVELS}
 
     def generate_report(
         self,
@@ -247,9 +364,7 @@ class DaggerScanner:
         """
         try:
             if format_type.lower() == "json":
-                import json
-
-                return json.dumps(results, indent=2)
+                return ReportGenerator().generate_json_report(results)
 
             if format_type.lower() == "html":
                 return self._generate_html_report(results)
@@ -5,18 +5,71 @@ This module defines the KPDaggerBaseModel that serves as the foundation
 for all other SQLModel-based models in the application.
 """
 
+import os
 from datetime import datetime
-from typing import TYPE_CHECKING
-from uuid import UUID, uuid4
+from functools import cache
+from typing import TYPE_CHECKING, Any, ClassVar
+from uuid import UUID
 
 from pydantic import ConfigDict
 from sqlmodel import Field, SQLModel
 
-from kp_dagger.utils.get_timestamp import get_iso_timestamp
+from kp_dagger.utils.get_timestamp import get_timestamp
 
 if TYPE_CHECKING:
     from kp_dagger.core.encryption import TenantEncryptionService
 
+# Random UUIDs are generated in batches from a single os.urandom() call
+_UUID_POOL_SIZE = 256
+_uuid_pool: list[UUID] = []
+
+# A forked child must not hand out the parent's remaining UUIDs
+os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+def pooled_uuid() -> UUID:
+    """Return a random (version 4) UUID from the pre-generated pool."""
+    # Pop first and refill on IndexError; another thread may drain the pool
+    # between an emptiness check and the pop
+    while True:
+        try:
+            return _uuid_pool.pop()
+        except IndexError:
+            blob = os.urandom(16 * _UUID_POOL_SIZE)
+            _uuid_pool.extend(
+                [
+                    UUID(bytes=blob[i : i + 16], version=4)
+                    for i in range(0, len(blob), 16)
+                ],
+            )
+
+
+def schema_example(example: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Return JSON schema extras carrying an example, if examples are enabled.
+
+    Examples are only used by API schema exporters, so they are attached to
+    model configurations only when the ``DAGGER_SCHEMA_EXAMPLES`` environment
+    variable is non-empty. It is read when a model class is defined, so it must
+    be set before the models are imported.
+
+    Args:
+        example: Example record for the model's JSON schema
+
+    Returns:
+        ``json_schema_extra`` value for the model configuration
+
+    """
+    if os.environ.get("DAGGER_SCHEMA_EXAMPLES"):
+        return {"example": example}
+    return None
+
+
+@cache
+def _json_schema(model: type[SQLModel]) -> dict[str, Any]:
+    """Build the JSON schema of a model class once."""
+    return model.model_json_schema()
+
 
 class DaggerConfigMixin(SQLModel):
     """
@@ -35,9 +88,14 @@ class DaggerConfigMixin(SQLModel):
         use_enum_values=True,
     )
 
-    class Config:
-        # Mark as abstract so SQLAlchemy doesn't create a table
-        abstract = True
+    @classmethod
+    def cached_json_schema(cls) -> dict[str, Any]:
+        """
+        Return the model's JSON schema, built on first use.
+
+        The schema is shared between callers and must not be modified.
+        """
+        return _json_schema(cls)
 
 
 class KPDaggerBaseModel(DaggerConfigMixin):
@@ -58,7 +116,7 @@ class KPDaggerBaseModel(DaggerConfigMixin):
     """
 
     id: UUID = Field(
-        default_factory=uuid4,
+        default_factory=pooled_uuid,
         primary_key=True,
         description="Unique identifier for the record",
     )
@@ -70,15 +128,20 @@ class KPDaggerBaseModel(DaggerConfigMixin):
     )
 
     created_at: datetime = Field(
-        default_factory=get_iso_timestamp,
+        default_factory=get_timestamp,
         description="Timestamp when the record was created",
     )
 
     updated_at: datetime = Field(
-        default_factory=get_iso_timestamp,
+        default_factory=get_timestamp,
         description="Timestamp when the record was last updated",
     )
 
+    # (logical name, storage field) pairs for the class's EncryptedFields and
+    # the remaining plain field names, computed once per subclass
+    _ENCRYPTED_FIELDS: ClassVar[tuple[tuple[str, str], ...]] = ()
+    _PLAIN_FIELDS: ClassVar[tuple[str, ...]] = ()
+
     # Extended configuration for models with encryption support
     model_config = DaggerConfigMixin.model_config | ConfigDict(
         # Allow arbitrary types for encryption service and descriptors
@@ -86,24 +149,55 @@ class KPDaggerBaseModel(DaggerConfigMixin):
         # Ignore descriptor types
         ignored_types=(property,),
         # Add example data to JSON schema for API documentation
-        json_schema_extra={
-            "example": {
+        json_schema_extra=schema_example(
+            {
                 "id": "123e4567-e89b-12d3-a456-426614174000",
                 "tenant_id": "456e7890-e89b-12d3-a456-426614174000",
                 "created_at": "2024-01-01T00:00:00Z",
                 "updated_at": "2024-01-01T00:00:00Z",
             },
-        },
+        ),
     )
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:  # noqa: ANN401
+        """Collect the encrypted and plain field names of a new model class."""
+        super().__pydantic_init_subclass__(**kwargs)
+        from kp_dagger.models.base.encryption import EncryptedField
+
+        encrypted: dict[str, str] = {}
+        for klass in reversed(cls.__mro__):
+            for name, attr in vars(klass).items():
+                if isinstance(attr, EncryptedField):
+                    encrypted[name] = attr.storage_field
+        cls._ENCRYPTED_FIELDS = tuple(encrypted.items())
+        cls._PLAIN_FIELDS = tuple(
+            name
+            for name in cls.model_fields
+            if name not in encrypted and name not in encrypted.values()
+        )
+
     def __init__(self, **data: object) -> None:
-        """Initialize model with optional encryption service."""
+        """
+        Initialize model with optional encryption service.
+
+        Plaintext values for encrypted fields are assigned through their
+        ``EncryptedField`` after validation, so they are encrypted with the
+        given service rather than dropped as unknown keywords.
+        """
         # Extract encryption service if provided
         self._encryption_service: TenantEncryptionService | None = data.pop(
             "_encryption_service",
             None,
         )
+        encrypted_values = {
+            name: data.pop(name)
+            for name, _ in type(self)._ENCRYPTED_FIELDS
+            if name in data
+        }
         super().__init__(**data)
+        for name, value in encrypted_values.items():
+            setattr(self, name, value)
 
     def set_encryption_service(self, service: "TenantEncryptionService") -> None:
         """Set the encryption service for this model instance."""
@@ -116,20 +210,8 @@ class KPDaggerBaseModel(DaggerConfigMixin):
         This is useful for database storage where encrypted fields should
         remain encrypted.
         """
-        data = {}
-        for field_name in self.model_fields:
-            if hasattr(self.__class__, field_name):
-                attr = getattr(self.__class__, field_name)
-                if isinstance(
-                    attr,
-                    type(self).__dict__.get(field_name, None),
-                ) and hasattr(attr, "storage_field"):
-                    # This is an EncryptedField, get the storage field
-                    storage_value = getattr(self, attr.storage_field, None)
-                    data[attr.storage_field] = storage_value
-                    continue
-
-            # Regular field
-            data[field_name] = getattr(self, field_name, None)
-
+        cls = type(self)
+        data = {name: getattr(self, name, None) for name in cls._PLAIN_FIELDS}
+        for _, storage_field in cls._ENCRYPTED_FIELDS:
+            data[storage_field] = getattr(self, storage_field, None)
         return data
@@ -5,18 +5,43 @@ Provides transparent field-level encryption for SQLModel models using
 the TenantEncryptionService.
 """
 
+from typing import TYPE_CHECKING
+
+from sqlalchemy.orm.attributes import set_attribute
+from sqlalchemy.orm.instrumentation import is_instrumented
+
 from kp_dagger.core.encryption import DecryptionError
 
+if TYPE_CHECKING:
+    from kp_dagger.models.base.base import KPDaggerBaseModel
+
+# Marks a field whose decrypted value has not been cached yet
+_MISSING = object()
+
 
-class EncryptedField:
+class EncryptedField(property):
     """
     Descriptor for transparent field-level encryption in SQLModel models.
 
     This descriptor automatically encrypts data when setting field values
     and decrypts when retrieving them, providing transparent encryption
     for sensitive model fields.
+
+    Decrypted values are cached in the instance ``__dict__`` under the field
+    name. The descriptor defines ``__set__``, so it always takes precedence
+    over that entry during attribute lookup. It subclasses ``property`` so
+    that Pydantic routes attribute assignment to ``__set__`` instead of
+    validating it as a model field.
+
+    The instance ``__dict__`` is probed directly for both the cached plaintext
+    and the stored ciphertext; the generic attribute lookup is only used when
+    the ciphertext is not loaded there yet (for example an expired ORM
+    attribute). Ciphertext is written straight to the mapped column, so the
+    storage field is not re-validated by Pydantic on every assignment.
     """
 
+    __slots__ = ("name", "nullable", "storage_field")
+
     def __init__(self, storage_field: str, *, nullable: bool = True) -> None:
         """
         Initialize the encrypted field descriptor.
@@ -32,7 +57,6 @@ class EncryptedField:
     def __set_name__(self, owner: type, name: str) -> None:
         """Set the attribute name when the descriptor is assigned to a class."""
         self.name = name
-        self.private_name = f"_{name}"
 
     def __get__(
         self,
@@ -44,11 +68,15 @@ class EncryptedField:
             return self
 
         # Check if we have a cached decrypted value
-        if hasattr(obj, self.private_name):
-            return getattr(obj, self.private_name)
+        cache = obj.__dict__
+        cached = cache.get(self.name, _MISSING)
+        if cached is not _MISSING:
+            return cached
 
         # Get encrypted data from storage field
-        encrypted_data = getattr(obj, self.storage_field, None)
+        encrypted_data = cache.get(self.storage_field, _MISSING)
+        if encrypted_data is _MISSING:
+            encrypted_data = getattr(obj, self.storage_field, None)
         if encrypted_data is None:
             return None
 
@@ -61,7 +89,7 @@ class EncryptedField:
         try:
             decrypted_value = encryption_service.decrypt(encrypted_data)
             # Cache the decrypted value
-            setattr(obj, self.private_name, decrypted_value)
+            cache[self.name] = decrypted_value
         except DecryptionError:
             # Return None for corrupted data instead of raising
             return None
@@ -71,14 +99,21 @@ class EncryptedField:
     def __set__(self, obj: "KPDaggerBaseModel", value: str | None) -> None:
         """Set the field value with encryption."""
         if value is None and self.nullable:
-            setattr(obj, self.storage_field, None)
-            setattr(obj, self.private_name, None)
+            self.set_encrypted(obj, None)
+            obj.__dict__[self.name] = None
             return
 
         if value is None and not self.nullable:
             msg = f"Field {self.name} cannot be None"
             raise ValueError(msg)
 
+        # Skip re-encryption when the stored ciphertext already holds this value
+        if (
+            obj.__dict__.get(self.name, _MISSING) == value
+            and getattr(obj, self.storage_field, None) is not None
+        ):
+            return
+
         # Encrypt the value
         encryption_service = getattr(obj, "_encryption_service", None)
         if encryption_service is None:
@@ -86,12 +121,29 @@ class EncryptedField:
             raise RuntimeError(msg)
 
         encrypted_data = encryption_service.encrypt(str(value))
-        setattr(obj, self.storage_field, encrypted_data)
+        self.set_encrypted(obj, encrypted_data)
         # Cache the plaintext value
-        setattr(obj, self.private_name, value)
+        obj.__dict__[self.name] = value
 
     def __delete__(self, obj: "KPDaggerBaseModel") -> None:
         """Delete the field value."""
-        setattr(obj, self.storage_field, None)
-        if hasattr(obj, self.private_name):
-            delattr(obj, self.private_name)
+        self.set_encrypted(obj, None)
+        obj.__dict__.pop(self.name, None)
+
+    def set_encrypted(self, obj: "KPDaggerBaseModel", data: bytes | None) -> None:
+        """
+        Store already-encrypted data in the storage field.
+
+        Mapped columns are set through SQLAlchemy directly, which records the
+        change for the next flush without running Pydantic assignment
+        validation. The cached plaintext is left untouched.
+
+        Args:
+            obj: Model instance to update
+            data: Ciphertext from the tenant encryption service, or None
+
+        """
+        if is_instrumented(obj, self.storage_field):
+            set_attribute(obj, self.storage_field, data)
+        else:
+            setattr(obj, self.storage_field, data)
@@ -5,13 +5,36 @@ This module defines the Tenant model that serves as the foundation
 for multi-tenant data isolation in Dagger.
 """
 
+import re
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from pydantic import ConfigDict
+from sqlalchemy import CheckConstraint
 from sqlmodel import Field
 
-from kp_dagger.utils.get_timestamp import get_iso_timestamp
+from kp_dagger.models.base.base import (
+    DaggerConfigMixin,
+    pooled_uuid,
+    schema_example,
+)
+from kp_dagger.utils.get_timestamp import get_timestamp
+
+# Runs of characters that are not allowed in a slug; each run becomes one hyphen
+_SLUG_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+# Example tenant for the API documentation schema
+_TENANT_EXAMPLE = {
+    "id": "456e7890-e89b-12d3-a456-426614174000",
+    "name": "Acme Corporation",
+    "slug": "acme-corp",
+    "is_active": True,
+    "created_at": "2024-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+    "description": "Large enterprise tenant",
+    "timezone": "UTC",
+    "retention_policy_days": 0,
+}
 
 
 class Tenant(DaggerConfigMixin, table=True):
@@ -23,9 +46,21 @@ class Tenant(DaggerConfigMixin, table=True):
     """
 
     __tablename__ = "tenants"
+    # Slugs may only contain lowercase letters, digits and hyphens; the format
+    # is checked by the database on write
+    __table_args__ = (
+        CheckConstraint(
+            r"slug ~ '^[a-z0-9-]+$'",
+            name="ck_tenants_slug_format",
+        ).ddl_if(dialect=("postgresql", "duckdb")),
+        CheckConstraint(
+            "slug <> '' AND slug NOT GLOB '*[^a-z0-9-]*'",
+            name="ck_tenants_slug_format",
+        ).ddl_if(dialect="sqlite"),
+    )
 
     id: UUID = Field(
-        default_factory=uuid4,
+        default_factory=pooled_uuid,
         primary_key=True,
         description="Unique identifier for the tenant",
     )
@@ -38,7 +73,6 @@ class Tenant(DaggerConfigMixin, table=True):
     slug: str = Field(
         unique=True,
         max_length=100,
-        regex=r"^[a-z0-9-]+$",  # Only lowercase, numbers, hyphens
         description="URL-safe tenant identifier (e.g., 'acme-corp')",
     )
 
@@ -48,12 +82,12 @@ class Tenant(DaggerConfigMixin, table=True):
     )
 
     created_at: datetime = Field(
-        default_factory=get_iso_timestamp,
+        default_factory=get_timestamp,
         description="Timestamp when the tenant was created",
     )
 
     updated_at: datetime = Field(
-        default_factory=get_iso_timestamp,
+        default_factory=get_timestamp,
         description="Timestamp when the tenant was last updated",
     )
 
@@ -79,19 +113,7 @@ class Tenant(DaggerConfigMixin, table=True):
     # Configuration extending base settings with tenant-specific examples
     model_config = DaggerConfigMixin.model_config | ConfigDict(
         # Add example data to JSON schema for API documentation
-        json_schema_extra={
-            "example": {
-                "id": "456e7890-e89b-12d3-a456-426614174000",
-                "name": "Acme Corporation",
-                "slug": "acme-corp",
-                "is_active": True,
-                "created_at": "2024-01-01T00:00:00Z",
-                "updated_at": "2024-01-01T00:00:00Z",
-                "description": "Large enterprise tenant",
-                "timezone": "UTC",
-                "retention_policy_days": 0,
-            },
-        },
+        json_schema_extra=schema_example(_TENANT_EXAMPLE),
     )
 
     @classmethod
@@ -110,15 +132,10 @@ class Tenant(DaggerConfigMixin, table=True):
             'acme-corporation'
 
         """
-        import re
-
-        # Convert to lowercase, replace spaces/special chars with hyphens
-        slug = re.sub(r"[^a-z0-9]+", "-", name.lower())
-        # Remove leading/trailing hyphens and collapse multiple hyphens
-        slug = re.sub(r"^-+|-+$", "", slug)
-        slug = re.sub(r"-+", "-", slug)
-        return slug
+        # Replace runs of spaces/special chars (hyphens included) with a single
+        # hyphen, then drop leading/trailing hyphens
+        return _SLUG_SEPARATORS.sub("-", name.lower()).strip("-")
 
     def update_timestamp(self) -> None:
         """Update the updated_at timestamp to current time."""
-        self.updated_at = get_iso_timestamp()
+        self.updated_at = get_timestamp()
@@ -1,7 +1,12 @@
 """Custom field types for network concepts."""
 
 import ipaddress
-from collections.abc import Generator
+import socket
+from collections.abc import Generator, Mapping
+from enum import Enum
+
+from sqlalchemy import Dialect, SmallInteger
+from sqlalchemy.types import TypeDecorator
 
 
 class IPAddress(str):
@@ -18,6 +23,14 @@ class IPAddress(str):
     def validate(cls, value: object) -> str:
         """Validate IP address format."""
         if isinstance(value, str):
+            # Strict dotted-quad IPv4 is accepted by one C call; anything else
+            # (IPv6, malformed input) goes through the ipaddress module
+            try:
+                socket.inet_pton(socket.AF_INET, value)
+            except (OSError, ValueError):
+                pass
+            else:
+                return value
             try:
                 ipaddress.ip_address(value)
             except ValueError as exc:
@@ -52,3 +65,40 @@ class NetworkAddress(str):
                 return value
         msg = f"Network address must be string, got {type(value)}"
         raise ValueError(msg)
+
+
+class EnumCode(TypeDecorator):
+    """
+    Column type storing string enum members as small integer codes.
+
+    The enum keeps its string values for the API and CLI, while the database
+    column holds a compact integer that compares and indexes as one.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, codes: Mapping[Enum, int]) -> None:
+        """
+        Create the column type.
+
+        Args:
+            codes: Database code for every enum member
+
+        """
+        super().__init__()
+        self.codes = tuple(codes.items())
+        self._code_by_member = dict(self.codes)
+        self._member_by_code = {code: member for member, code in self.codes}
+
+    def process_bind_param(self, value: object, dialect: Dialect) -> int | None:  # noqa: ARG002
+        """Convert an enum member or its value to the stored code."""
+        if value is None:
+            return None
+        return self._code_by_member[value]
+
+    def process_result_value(self, value: int | None, dialect: Dialect) -> Enum | None:  # noqa: ARG002
+        """Convert a stored code back to its enum member."""
+        if value is None:
+            return None
+        return self._member_by_code[value]
@@ -1,5 +1,7 @@
 """Normalized database schema models."""
 
+from sqlalchemy.orm import configure_mappers
+
 from kp_dagger.models.normalized.device import Device
 from kp_dagger.models.normalized.ip_address import IPAddress
 
@@ -7,3 +9,6 @@ __all__ = [
     "Device",
     "IPAddress",
 ]
+
+# Configure the ORM mappers now (a few ms) rather than on the first session use
+configure_mappers()
@@ -2,8 +2,10 @@
 
 from uuid import UUID
 
+from sqlalchemy import ForeignKeyConstraint
 from sqlmodel import Field
 
+from kp_dagger.models.base.base import KPDaggerBaseModel
 from kp_dagger.models.base.enums import DeviceType
 
 
@@ -12,6 +14,18 @@ class Device(KPDaggerBaseModel, table=True):
 
     __tablename__ = "devices"
 
+    # devices and ip_addresses reference each other, so this side of the cycle
+    # is added after both tables exist. DuckDB cannot ALTER TABLE ADD FOREIGN
+    # KEY, so there the reference is left unenforced.
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["management_ip_id"],
+            ["ip_addresses.id"],
+            name="fk_devices_management_ip",
+            use_alter=True,
+        ).ddl_if(dialect=("postgresql", "sqlite")),
+    )
+
     hostname: str = Field(
         description="Device hostname as configured",
     )
@@ -42,7 +56,6 @@ class Device(KPDaggerBaseModel, table=True):
 
     management_ip_id: UUID | None = Field(
         default=None,
-        foreign_key="ip_addresses.id",
         description="Reference to management IP address",
     )
 
@@ -6,11 +6,65 @@ across different device types and configurations. It supports both IPv4 and IPv6
 addresses with original and normalized representations.
 """
 
+import ipaddress
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Self
 from uuid import UUID
 
-from sqlmodel import Field
+from pydantic import ConfigDict
+from sqlalchemy import Column, Index, insert
+from sqlmodel import Field, Session
 
+from kp_dagger.models.base.base import KPDaggerBaseModel
+from kp_dagger.models.base.encryption import EncryptedField
 from kp_dagger.models.base.enums import IPVersion
+from kp_dagger.models.base.types import EnumCode
+from kp_dagger.utils.get_timestamp import batched_timestamps
+
+if TYPE_CHECKING:
+    from kp_dagger.core.encryption import TenantEncryptionService
+
+# Plaintext fields whose values are stored encrypted
+_ENCRYPTED_ADDRESS_FIELDS = ("original_address", "normalized_address")
+
+# Address classification bits packed into IPAddress.flags
+FLAG_PRIVATE = 1 << 0
+FLAG_LOOPBACK = 1 << 1
+FLAG_MULTICAST = 1 << 2
+
+# Former boolean columns, now read-only properties backed by IPAddress.flags
+_FLAG_PROPERTIES = ("is_private", "is_loopback", "is_multicast")
+
+
+@lru_cache(maxsize=4096)
+def address_flags(address: str) -> int:
+    """
+    Classify an address into its IPAddress.flags bitmask.
+
+    The address is parsed once; prefix notation (``10.0.0.0/8``) is accepted.
+    Values that are not IP addresses yield no flags.
+
+    Args:
+        address: IP address, optionally with a prefix length
+
+    Returns:
+        Bitmask of FLAG_PRIVATE, FLAG_LOOPBACK and FLAG_MULTICAST
+
+    """
+    try:
+        # Plain addresses skip building the interface's network object
+        if "/" in address:
+            ip = ipaddress.ip_interface(address).ip
+        else:
+            ip = ipaddress.ip_address(address)
+    except ValueError:
+        return 0
+    return (
+        (FLAG_PRIVATE if ip.is_private else 0)
+        | (FLAG_LOOPBACK if ip.is_loopback else 0)
+        | (FLAG_MULTICAST if ip.is_multicast else 0)
+    )
 
 
 class IPAddress(KPDaggerBaseModel, table=True):
@@ -24,9 +78,33 @@ class IPAddress(KPDaggerBaseModel, table=True):
     """
 
     __tablename__ = "ip_addresses"
+    # Addresses are read per tenant and device. The composite index leads with
+    # tenant_id, so tenant_id is redeclared here without the base model's
+    # single-column index, which would duplicate it.
+    __table_args__ = (
+        Index("idx_ip_addresses_tenant_device", "tenant_id", "device_id"),
+    )
+
+    # Addresses are created in bulk and populated one field at a time, so
+    # assignments skip re-validation. Table models are not validated by
+    # __init__ either; bulk_create validates each row with model_validate.
+    model_config = KPDaggerBaseModel.model_config | ConfigDict(
+        validate_assignment=False,
+    )
+
+    tenant_id: UUID = Field(
+        foreign_key="tenants.id",
+        description="Tenant this record belongs to",
+    )
 
     # Basic IP address information
-    version: IPVersion = Field(description="IP version (IPv4 or IPv6)")
+    version: IPVersion = Field(
+        sa_column=Column(
+            EnumCode({IPVersion.IPV4: 4, IPVersion.IPV6: 6}),
+            nullable=False,
+        ),
+        description="IP version (IPv4 or IPv6)",
+    )
 
     # Storage fields for encrypted data (not exposed in API)
     original_address_encrypted: bytes | None = Field(
@@ -48,25 +126,18 @@ class IPAddress(KPDaggerBaseModel, table=True):
         le=128,
     )
 
-    is_private: bool = Field(
-        default=False,
-        description="Whether this is a private/internal IP address",
-    )
-
-    is_loopback: bool = Field(
-        default=False,
-        description="Whether this is a loopback address",
-    )
-
-    is_multicast: bool = Field(
-        default=False,
-        description="Whether this is a multicast address",
+    flags: int = Field(
+        default=0,
+        description="Address classification bitmask (private, loopback, multicast)",
+        ge=0,
+        le=FLAG_PRIVATE | FLAG_LOOPBACK | FLAG_MULTICAST,
     )
 
     # Reference to source configuration
     device_id: UUID | None = Field(
         default=None,
         foreign_key="devices.id",
+        index=True,
         description="Device this IP address was found on",
     )
 
@@ -80,67 +151,171 @@ class IPAddress(KPDaggerBaseModel, table=True):
         description="Configuration context (interface, ACL, route, etc.)",
     )
 
-    # Encrypted field properties
+    # Encrypted field accessors
+    original_address = EncryptedField("original_address_encrypted")
+    normalized_address = EncryptedField("normalized_address_encrypted")
+
+    def __init__(self, **data: object) -> None:
+        """
+        Initialize the record, deriving ``flags`` from its address.
+
+        When ``flags`` is not given it is computed from the normalized (or
+        original) address. The classification properties cannot be passed
+        as keywords, since they are derived from ``flags``.
+
+        Raises:
+            TypeError: If a classification property is passed as a keyword
+
+        """
+        derived = [name for name in _FLAG_PROPERTIES if name in data]
+        if derived:
+            msg = f"{', '.join(derived)} derived from flags; pass flags instead"
+            raise TypeError(msg)
+
+        if "flags" not in data:
+            address = data.get("normalized_address") or data.get("original_address")
+            if address:
+                data["flags"] = address_flags(address)
+
+        super().__init__(**data)
+
     @property
-    def original_address(self) -> str | None:
-        """Get the original address (decrypted)."""
-        if not hasattr(self, "_original_address_cached"):
-            if self.original_address_encrypted is None:
-                return None
-            if self._encryption_service is None:
-                msg = "Encryption service not available for decryption"
-                raise RuntimeError(msg)
-            try:
-                self._original_address_cached = self._encryption_service.decrypt(
-                    self.original_address_encrypted,
-                )
-            except Exception:  # noqa: BLE001
-                return None
-        return self._original_address_cached
-
-    @original_address.setter
-    def original_address(self, value: str | None) -> None:
-        """Set the original address (encrypted)."""
-        if value is None:
-            self.original_address_encrypted = None
-            self._original_address_cached = None
-            return
-
-        if self._encryption_service is None:
-            msg = "Encryption service not available for encryption"
-            raise RuntimeError(msg)
-
-        self.original_address_encrypted = self._encryption_service.encrypt(value)
-        self._original_address_cached = value
+    def is_private(self) -> bool:
+        """Whether this is a private/internal IP address."""
+        return bool(self.flags & FLAG_PRIVATE)
 
     @property
-    def normalized_address(self) -> str | None:
-        """Get the normalized address (decrypted)."""
-        if not hasattr(self, "_normalized_address_cached"):
-            if self.normalized_address_encrypted is None:
-                return None
-            if self._encryption_service is None:
-                msg = "Encryption service not available for decryption"
-                raise RuntimeError(msg)
-            try:
-                self._normalized_address_cached = self._encryption_service.decrypt(
-                    self.normalized_address_encrypted,
-                )
-            except Exception:  # noqa: BLE001
-                return None
-        return self._normalized_address_cached
-
-    @normalized_address.setter
-    def normalized_address(self, value: str | None) -> None:
-        """Set the normalized address (encrypted)."""
-        if value is None:
-            self.normalized_address_encrypted = None
-            self._normalized_address_cached = None
-            return
-
-        if self._encryption_service is None:
-            msg = "Encryption service not available for encryption"
-            raise RuntimeError(msg)
-
-        self.normalized_address_encrypted = self._encryption_service.encrypt(value)
-        self._normalized_address_cached = value
+    def is_loopback(self) -> bool:
+        """Whether this is a loopback address."""
+        return bool(self.flags & FLAG_LOOPBACK)
+
+    @property
+    def is_multicast(self) -> bool:
+        """Whether this is a multicast address."""
+        return bool(self.flags & FLAG_MULTICAST)
+
+    @classmethod
+    def bulk_create(
+        cls,
+        rows: Iterable[Mapping[str, Any]],
+        encryption_service: "TenantEncryptionService",
+    ) -> list[Self]:
+        """
+        Create many IP address records with one batched encryption pass.
+
+        Each row holds model field values and may include plaintext
+        ``original_address``/``normalized_address`` values. All plaintexts are
+        encrypted with a single ``encrypt_many`` call instead of one
+        ``encrypt`` call per field. Rows without ``flags`` get them computed
+        from the normalized (or original) address. Each row is checked with
+        ``model_validate``, so invalid versions, prefix lengths or flags raise
+        a ``ValidationError``. All records share one
+        ``created_at``/``updated_at`` timestamp.
+
+        Args:
+            rows: Field values for each record
+            encryption_service: Tenant encryption service for the records
+
+        Returns:
+            Created IP address records, in input order
+
+        """
+        records: list[Self] = []
+        targets: list[tuple[Self, str]] = []
+        plaintexts: list[str] = []
+
+        with batched_timestamps():
+            for row in rows:
+                values = dict(row)
+                addresses = {
+                    field: values.pop(field, None)
+                    for field in _ENCRYPTED_ADDRESS_FIELDS
+                }
+                if "flags" not in values:
+                    address = (
+                        addresses["normalized_address"] or addresses["original_address"]
+                    )
+                    if address:
+                        values["flags"] = address_flags(address)
+                record = cls.model_validate(values)
+                record.set_encryption_service(encryption_service)
+                for field, address in addresses.items():
+                    record.__dict__[field] = address
+                    if address is not None:
+                        targets.append((record, field))
+                        plaintexts.append(address)
+                records.append(record)
+
+        ciphertexts = encryption_service.encrypt_many(plaintexts)
+        for (record, field), ciphertext in zip(targets, ciphertexts, strict=True):
+            getattr(cls, field).set_encrypted(record, ciphertext)
+
+        return records
+
+    @classmethod
+    def bulk_create_unique(
+        cls,
+        rows: Iterable[Mapping[str, Any]],
+        encryption_service: "TenantEncryptionService",
+    ) -> dict[str, Self]:
+        """
+        Create one IP address record per distinct address.
+
+        Rows are keyed on their normalized (or original) address. Only the
+        first row for each address is created and encrypted; later rows for
+        the same address are dropped so callers can reference the existing
+        record's ``id`` instead. Rows without an address are ignored.
+
+        Args:
+            rows: Field values for each record
+            encryption_service: Tenant encryption service for the records
+
+        Returns:
+            Created records keyed by address, in first-seen order
+
+        """
+        unique_rows: dict[str, Mapping[str, Any]] = {}
+        for row in rows:
+            address = row.get("normalized_address") or row.get("original_address")
+            if address and address not in unique_rows:
+                unique_rows[address] = row
+
+        records = cls.bulk_create(unique_rows.values(), encryption_service)
+        return dict(zip(unique_rows, records, strict=True))
+
+    @classmethod
+    def bulk_insert(
+        cls,
+        session: Session,
+        rows: Iterable[Mapping[str, Any]],
+        encryption_service: "TenantEncryptionService",
+    ) -> list[Self]:
+        """
+        Insert many IP address records with one batched INSERT statement.
+
+        Records are built and encrypted with ``bulk_create`` and then written
+        through a single Core ``INSERT`` instead of one ORM flush per object.
+        The returned records are not attached to the session.
+
+        Args:
+            session: Database session to execute the insert in
+            rows: Field values for each record
+            encryption_service: Tenant encryption service for the records
+
+        Returns:
+            Inserted IP address records, in input order
+
+        """
+        records = cls.bulk_create(rows, encryption_service)
+        if not records:
+            return records
+
+        columns = [column.name for column in cls.__table__.columns]
+        session.execute(
+            insert(cls.__table__),
+            [
+                {column: record.__dict__.get(column) for column in columns}
+                for record in records
+            ],
+        )
+        return records
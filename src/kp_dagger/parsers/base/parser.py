@@ -1,8 +1,15 @@
 """Base parser class for all device configuration parsers."""
 
+import re
 from abc import ABC, abstractmethod
 from typing import Any
 
+# First "hostname <name>" line, matched case-insensitively after any indent
+_HOSTNAME_RE = re.compile(
+    r"^[^\S\n]*hostname [^\S\n]*(\S+)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
 
 class BaseParser(ABC):
     """Abstract base class for device configuration parsers."""
@@ -106,11 +113,5 @@ class BaseParser(ABC):
         Returns:
             Hostname if found, None otherwise
         """
-        lines = self._parse_lines(config_text)
-        for line in lines:
-            normalized = self._normalize_line(line)
-            if normalized.startswith("hostname "):
-                parts = line.strip().split()
-                if len(parts) >= 2:
-                    return parts[1]
-        return None
+        match = _HOSTNAME_RE.search(config_text)
+        return match.group(1) if match else None
@@ -1,6 +1,7 @@
 """Parser factory for creating device-specific parsers."""
 
-from typing import TYPE_CHECKING
+import importlib
+from typing import TYPE_CHECKING, Final
 
 from kp_dagger.core.exceptions import UnsupportedDeviceError
 from kp_dagger.models.base.enums import DeviceType
@@ -8,47 +9,46 @@ from kp_dagger.models.base.enums import DeviceType
 if TYPE_CHECKING:
     from kp_dagger.parsers.base.parser import BaseParser
 
+# Parser classes by device type as (module, class name), imported on first use
+_PARSER_PATHS: Final[dict[DeviceType, tuple[str, str]]] = {
+    DeviceType.CISCO_IOS: ("kp_dagger.parsers.cisco_ios.parser", "CiscoIOSParser"),
+    DeviceType.CISCO_ASA: ("kp_dagger.parsers.cisco_asa.parser", "CiscoASAParser"),
+    DeviceType.FORTIGATE: ("kp_dagger.parsers.fortigate.parser", "FortigateParser"),
+    DeviceType.PALOALTO: ("kp_dagger.parsers.paloalto.parser", "PaloaltoParser"),
+}
 
-class ParserFactory:
-    """Factory class for creating device-specific parsers."""
+# Parser classes that have already been imported
+_PARSERS: dict[DeviceType, type["BaseParser"]] = {}
 
-    def __init__(self) -> None:
-        """Initialize the parser factory."""
-        self._parsers: dict[DeviceType, type[BaseParser]] = {}
-        self._register_parsers()
+# Device types whose parser module failed to import
+_UNAVAILABLE: set[DeviceType] = set()
 
-    def _register_parsers(self) -> None:
-        """Register all available parsers."""
-        # Import parsers here to avoid circular imports
-        try:
-            from kp_dagger.parsers.cisco_ios.parser import CiscoIOSParser
 
-            self._parsers[DeviceType.CISCO_IOS] = CiscoIOSParser
-        except ImportError:
-            pass
+def _import_parser_class(device_type: DeviceType) -> type["BaseParser"] | None:
+    """Import and cache a parser class, returning None if it cannot be loaded."""
+    if device_type in _PARSERS:
+        return _PARSERS[device_type]
+    if device_type in _UNAVAILABLE or device_type not in _PARSER_PATHS:
+        return None
 
-        try:
-            from kp_dagger.parsers.cisco_asa.parser import CiscoASAParser
+    module_name, class_name = _PARSER_PATHS[device_type]
+    try:
+        parser_class = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError):
+        _UNAVAILABLE.add(device_type)
+        return None
 
-            self._parsers[DeviceType.CISCO_ASA] = CiscoASAParser
-        except ImportError:
-            pass
+    _PARSERS[device_type] = parser_class
+    return parser_class
 
-        try:
-            from kp_dagger.parsers.fortigate.parser import (
-                FortigateParser,
-            )
 
-            self._parsers[DeviceType.FORTIGATE] = FortigateParser
-        except ImportError:
-            pass
+def _available_device_types() -> list[DeviceType]:
+    """Return the registered device types whose parsers import successfully."""
+    return [t for t in _PARSER_PATHS if _import_parser_class(t) is not None]
 
-        try:
-            from kp_dagger.parsers.paloalto.parser import PaloaltoParser
 
-            self._parsers[DeviceType.PALOALTO] = PaloaltoParser
-        except ImportError:
-            pass
+class ParserFactory:
+    """Factory class for creating device-specific parsers."""
 
     def get_parser(self, device_type: DeviceType) -> "BaseParser":
         """
@@ -64,14 +64,12 @@ class ParserFactory:
             UnsupportedDeviceError: If no parser is available for the device type
 
         """
-        if device_type not in self._parsers:
-            supported_types = list(self._parsers.keys())
+        parser_class = _import_parser_class(device_type)
+        if parser_class is None:
             raise UnsupportedDeviceError(
                 device_type.value,
-                [t.value for t in supported_types],
+                [t.value for t in _available_device_types()],
             )
-
-        parser_class = self._parsers[device_type]
         return parser_class()
 
     def get_supported_device_types(self) -> list[DeviceType]:
@@ -82,4 +80,4 @@ class ParserFactory:
             List of supported device types
 
         """
-        return list(self._parsers.keys())
+        return _available_device_types()
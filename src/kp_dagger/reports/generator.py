@@ -1,5 +1,6 @@
 """Report generation utilities."""
 
+import json
 from pathlib import Path
 from typing import Any
 
@@ -20,8 +21,6 @@ class ReportGenerator:
         Returns:
             JSON report string
         """
-        import json
-
         return json.dumps(data, indent=2)
 
     def generate_html_report(
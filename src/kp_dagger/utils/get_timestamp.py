@@ -8,16 +8,28 @@ Functions:
     get_timestamp: Main timestamp function with configurable output formats
     get_formatted_timestamp: Get filename-friendly timestamp (YYYYMMDD-HHMMSS)
     get_iso_timestamp: Get ISO 8601 formatted timestamp
+    batched_timestamps: Freeze the current time for a block of bulk work
 """
 
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime
+from time import gmtime, strftime
 
 __all__: list[str] = [
+    "batched_timestamps",
     "get_formatted_timestamp",
     "get_iso_timestamp",
     "get_timestamp",
 ]
 
+# Bound once so the hot helpers skip the attribute lookup on each call
+_now = datetime.now
+
+# Per-thread time shared by everything inside batched_timestamps()
+_frozen = threading.local()
+
 
 def get_timestamp(*, formatted: bool = False, iso: bool = False) -> datetime | str:
     """
@@ -37,17 +49,38 @@ def get_timestamp(*, formatted: bool = False, iso: bool = False) -> datetime | s
 
     """
     if formatted:
-        return datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+        return get_formatted_timestamp()
     if iso:
-        return datetime.now(UTC).isoformat()
-    return datetime.now(UTC)
+        return get_iso_timestamp()
+    return getattr(_frozen, "now", None) or _now(UTC)
 
 
 def get_formatted_timestamp() -> str:
     """Get a formatted timestamp string (YYYYMMDD-HHMMSS) suitable for filenames."""
-    return get_timestamp(formatted=True)
+    return strftime("%Y%m%d-%H%M%S", gmtime())
 
 
 def get_iso_timestamp() -> str:
     """Get an ISO 8601 formatted timestamp string."""
-    return get_timestamp(iso=True)
+    return (getattr(_frozen, "now", None) or _now(UTC)).isoformat()
+
+
+@contextmanager
+def batched_timestamps() -> Iterator[datetime]:
+    """
+    Freeze the current time for every timestamp taken inside the block.
+
+    Bulk operations that create many records at once give them all the same
+    creation time, reading the clock once. The freeze is per-thread, and a
+    nested block keeps the outer block's timestamp.
+
+    Yields:
+        The frozen time
+
+    """
+    outer = getattr(_frozen, "now", None)
+    _frozen.now = outer or _now(UTC)
+    try:
+        yield _frozen.now
+    finally:
+        _frozen.now = outer
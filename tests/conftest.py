@@ -1,11 +1,14 @@
 """Conftest for pytest configuration."""
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 import pytest
 
 from kp_dagger.core.database import DatabaseManager
+from kp_dagger.core.scanner import DaggerScanner
+from kp_dagger.parsers.factory import ParserFactory
 
 
 @pytest.fixture
@@ -25,18 +28,40 @@ def temp_config_file(tmp_path: Path) -> Path:
     return config_file
 
 
-@pytest.fixture
-def memory_database() -> DatabaseManager:
-    """Create an in-memory database for testing."""
+@pytest.fixture(scope="session")
+def _session_database() -> Iterator[DatabaseManager]:
+    """Create and initialize one in-memory database for the whole session."""
     db = DatabaseManager(":memory:")
     db.initialize()
-    return db
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def memory_database(_session_database: DatabaseManager) -> Iterator[DatabaseManager]:
+    """
+    Provide the shared in-memory database, emptied again after each test.
+
+    DatabaseManager commits its own writes, so tests are isolated by deleting
+    the rows left behind rather than by rolling back; the schema is kept for
+    the next test.
+    """
+    yield _session_database
+    connection = _session_database.connection
+    tables = connection.execute("SELECT table_name FROM duckdb_tables()").fetchall()
+    for (table,) in tables:
+        connection.execute(f'DELETE FROM "{table}"')
 
 
 @pytest.fixture
-def test_scanner() -> DaggerScanner:
-    """Create a test scanner instance."""
-    return DaggerScanner(database_path=":memory:")
+def test_scanner(memory_database: DatabaseManager) -> DaggerScanner:
+    """Create a test scanner instance backed by the shared test database."""
+    return DaggerScanner(
+        database_manager=memory_database,
+        parser_factory=ParserFactory(),
+        analyzers=None,
+        reporters=None,
+    )
 
 
 @pytest.fixture
@@ -2,12 +2,14 @@
 
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
 from kp_dagger.containers import ApplicationContainer
 from kp_dagger.containers.config import load_config, validate_config
+from kp_dagger.core.database import DatabaseManager
+from kp_dagger.core.scanner import DaggerScanner
 
 
 class TestDependencyInjectionIntegration:
@@ -42,8 +44,7 @@ class TestDependencyInjectionIntegration:
         assert container.report_container is not None
         assert container.api_client_container is not None
 
-    @patch("Dagger.core.database.DatabaseManager.initialize")
-    def test_scanner_creation_integration(self, mock_db_init: Mock) -> None:  # noqa: ARG002
+    def test_scanner_creation_integration(self) -> None:
         """Test that scanner can be created with all dependencies."""
         container = ApplicationContainer()
 
@@ -64,10 +65,22 @@ class TestDependencyInjectionIntegration:
 
         container.config.from_dict(config_data)
 
+        database_manager = container.core_container.database_manager
+        database_manager.override(Mock(spec=DatabaseManager))
+
         # Should be able to create scanner without errors
-        scanner = container.scanner()
-        assert scanner is not None
-        assert scanner.verbose is True
+        try:
+            scanner = DaggerScanner(
+                database_manager=database_manager(),
+                parser_factory=container.parser_container.parser_factory(),
+                analyzers=None,
+                reporters=None,
+                verbose=container.config.scanner.verbose(),
+            )
+            assert scanner is not None
+            assert scanner.verbose is True
+        finally:
+            database_manager.reset_override()
 
     def test_config_file_integration(self) -> None:
         """Test loading configuration from file and using it with container."""
@@ -0,0 +1 @@
+"""Tests for CLI commands and helpers."""
@@ -0,0 +1,26 @@
+"""Test the analyze command."""
+
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from kp_dagger.cli.main import main
+
+
+def test_analyze_directory(tmp_path: Path) -> None:
+    """Test that a directory argument analyzes the config files inside it."""
+    (tmp_path / "router.cfg").write_text("hostname router")
+
+    result = CliRunner().invoke(main, ["-v", "analyze", str(tmp_path)])
+
+    assert result.exit_code == 0
+    assert "1 configuration file(s)" in result.output
+
+
+def test_analyze_directory_without_configs(tmp_path: Path) -> None:
+    """Test that a directory with no config files fails instead of passing."""
+    (tmp_path / "notes.md").write_text("not a config")
+
+    result = CliRunner().invoke(main, ["analyze", str(tmp_path)])
+
+    assert result.exit_code == 1
@@ -0,0 +1,22 @@
+"""Test CLI configuration handling."""
+
+import pytest
+
+from kp_dagger.cli.utils.config import _coerce_option_value
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("TRUE", True),
+        ("false", False),
+        ("42", 42),
+        ("-7", -7),
+        ("verbose", "verbose"),
+        ("²", "²"),
+        ("1.5", "1.5"),
+    ],
+)
+def test_coerce_option_value(raw: str, expected: str | int | bool) -> None:
+    """Test that config --set values are coerced without raising."""
+    assert _coerce_option_value(raw) == expected
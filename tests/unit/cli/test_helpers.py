@@ -0,0 +1,33 @@
+"""Test CLI helper utilities."""
+
+from pathlib import Path
+
+from kp_dagger.cli.utils.helpers import expand_config_paths
+
+
+def test_expand_config_paths_keeps_files(tmp_path: Path) -> None:
+    """Test that file arguments are passed through unchanged."""
+    config_file = tmp_path / "router.bin"
+    config_file.write_text("hostname router")
+
+    assert expand_config_paths([config_file]) == [config_file]
+
+
+def test_expand_config_paths_walks_directories(tmp_path: Path) -> None:
+    """Test that directories expand to their config files in sorted order."""
+    (tmp_path / "site-b").mkdir()
+    (tmp_path / "site-b" / "fw.CONF").write_text("config system global")
+    (tmp_path / "core.cfg").write_text("hostname core")
+    (tmp_path / "notes.md").write_text("not a config")
+
+    assert expand_config_paths([tmp_path]) == [
+        tmp_path / "core.cfg",
+        tmp_path / "site-b" / "fw.CONF",
+    ]
+
+
+def test_expand_config_paths_empty_directory(tmp_path: Path) -> None:
+    """Test that a directory without config files expands to nothing."""
+    (tmp_path / "notes.md").write_text("not a config")
+
+    assert expand_config_paths([tmp_path]) == []
@@ -0,0 +1,16 @@
+"""Test the top-level CLI group."""
+
+import pytest
+from click.testing import CliRunner
+
+from kp_dagger import __version__
+from kp_dagger.cli.main import main
+
+
+@pytest.mark.parametrize("flag", ["--version", "-V"])
+def test_version_flags(flag: str) -> None:
+    """Test that both version flags show the version panel."""
+    result = CliRunner().invoke(main, [flag])
+
+    assert result.exit_code == 0
+    assert f"v{__version__}" in result.output
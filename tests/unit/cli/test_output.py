@@ -0,0 +1,55 @@
+"""Test CLI output helpers."""
+
+import logging
+from collections.abc import Iterator
+
+import pytest
+from rich.logging import RichHandler
+
+from kp_dagger.cli.utils import output
+
+
+@pytest.fixture
+def captured_records(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[list[logging.LogRecord]]:
+    """Capture the records the Rich handler receives from setup_logging."""
+    records: list[logging.LogRecord] = []
+    monkeypatch.setattr(
+        RichHandler, "emit", lambda _self, record: records.append(record)
+    )
+    root_logger = logging.getLogger()
+    level = root_logger.level
+    _reset_logging()
+
+    yield records
+
+    _reset_logging()
+    root_logger.setLevel(level)
+
+
+def _reset_logging() -> None:
+    """Remove the handler and listener installed by earlier setup_logging calls."""
+    output._stop_log_listener()
+    logging.getLogger().removeHandler(output._log_handler)
+    output._log_handler = None
+    output._logging_configured = None
+
+
+def test_rich_handler_receives_exc_info(
+    captured_records: list[logging.LogRecord],
+) -> None:
+    """Test that exception info reaches the Rich handler through the queue."""
+    output.setup_logging(verbose=1)
+
+    try:
+        msg = "boom"
+        raise ValueError(msg)
+    except ValueError:
+        logging.getLogger("kp_dagger.test").exception("Failed")
+    output._stop_log_listener()
+
+    (record,) = [r for r in captured_records if r.name == "kp_dagger.test"]
+    assert record.getMessage() == "Failed"
+    assert record.exc_info is not None
+    assert record.exc_info[0] is ValueError
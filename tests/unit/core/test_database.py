@@ -0,0 +1,33 @@
+"""Test database manager lifecycle."""
+
+from pathlib import Path
+
+from kp_dagger.core.database import DatabaseManager
+from kp_dagger.models.base.enums import DeviceType
+
+
+def test_initialize_is_idempotent(memory_database):
+    """Test that re-initializing keeps the connection and stored data."""
+    connection = memory_database.connection
+    device_id = memory_database.store_device_config(
+        DeviceType.CISCO_IOS,
+        Path("router-1.cfg"),
+        {},
+    )
+
+    memory_database.initialize()
+
+    assert memory_database.connection is connection
+    assert memory_database.get_device_config(device_id)["hostname"] == "router-1"
+
+
+def test_initialize_after_close():
+    """Test that a closed manager reconnects on the next initialize."""
+    db = DatabaseManager(":memory:")
+    db.initialize()
+    db.close()
+
+    db.initialize()
+
+    assert db.connection is not None
+    db.close()
@@ -2,11 +2,16 @@
 Unit tests for the encryption system.
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from uuid import uuid4
 
 import pytest
+from argon2.low_level import Type, hash_secret_raw
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 from kp_dagger.core.encryption import (
+    KEY_CACHE_SIZE,
     DecryptionError,
     EncryptionConfigError,
     EncryptionServiceManager,
@@ -15,6 +20,12 @@ from kp_dagger.core.encryption import (
 )
 
 
+@pytest.fixture(scope="module")
+def fast_kdf_config():
+    """Argon2id parameters cheap enough for tests (production defaults unchanged)."""
+    return KDFConfig(time_cost=1, memory_cost=8)
+
+
 class TestKDFConfig:
     """Test KDF configuration."""
 
@@ -49,20 +60,23 @@ class TestKDFConfig:
 class TestTenantEncryptionService:
     """Test tenant encryption service."""
 
-    @pytest.fixture
-    def tenant_id(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def tenant_id(cls):
         """Generate test tenant ID."""
         return uuid4()
 
-    @pytest.fixture
-    def runtime_key(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def runtime_key(cls):
         """Generate test runtime key."""
         return b"a" * 32
 
-    @pytest.fixture
-    def service(self, tenant_id, runtime_key):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def service(cls, tenant_id, runtime_key, fast_kdf_config):
         """Create test encryption service."""
-        return TenantEncryptionService(tenant_id, runtime_key)
+        return TenantEncryptionService(tenant_id, runtime_key, fast_kdf_config)
 
     def test_init_valid(self, tenant_id, runtime_key):
         """Test valid service initialization."""
@@ -76,31 +90,28 @@ class TestTenantEncryptionService:
         with pytest.raises(EncryptionConfigError, match="at least 32 bytes"):
             TenantEncryptionService(tenant_id, b"short")
 
-    def test_encrypt_decrypt_basic(self, service):
-        """Test basic encryption and decryption."""
-        plaintext = "Hello, World!"
+    @pytest.mark.parametrize(
+        "plaintext",
+        ["Hello, World!", "", "Hello, 世界! 🌍"],
+        ids=["basic", "empty", "unicode"],
+    )
+    def test_encrypt_decrypt_roundtrip(self, service, plaintext):
+        """Test encryption and decryption of plain, empty and unicode strings."""
         encrypted = service.encrypt(plaintext)
-        decrypted = service.decrypt(encrypted)
 
         assert isinstance(encrypted, bytes)
-        assert len(encrypted) > 0
-        assert decrypted == plaintext
+        assert (encrypted == b"") == (plaintext == "")
+        assert service.decrypt(encrypted) == plaintext
 
-    def test_encrypt_decrypt_empty(self, service):
-        """Test encryption of empty string."""
-        encrypted = service.encrypt("")
-        decrypted = service.decrypt(encrypted)
+    def test_encrypt_many(self, service):
+        """Test batch encryption of several values."""
+        plaintexts = ["10.0.0.1", "", "192.168.1.0/24"]
+        encrypted = service.encrypt_many(plaintexts)
 
-        assert encrypted == b""
-        assert decrypted == ""
-
-    def test_encrypt_decrypt_unicode(self, service):
-        """Test encryption of unicode strings."""
-        plaintext = "Hello, 世界! 🌍"
-        encrypted = service.encrypt(plaintext)
-        decrypted = service.decrypt(encrypted)
-
-        assert decrypted == plaintext
+        assert len(encrypted) == len(plaintexts)
+        assert encrypted[1] == b""
+        assert encrypted[0] != encrypted[2]
+        assert [service.decrypt(data) for data in encrypted] == plaintexts
 
     def test_encrypt_deterministic_salt(self, service):
         """Test that encryption produces different results due to random salt."""
@@ -112,18 +123,103 @@ class TestTenantEncryptionService:
         assert service.decrypt(encrypted1) == plaintext
         assert service.decrypt(encrypted2) == plaintext
 
+    def test_encrypt_reuses_write_salt(self, service):
+        """Test that consecutive encryptions share a salt but not a nonce."""
+        salt_end = 1 + service.kdf_config.salt_length
+        encrypted1 = service.encrypt("first")
+        encrypted2 = service.encrypt("second")
+
+        assert encrypted1[:salt_end] == encrypted2[:salt_end]
+        assert (
+            encrypted1[salt_end : salt_end + 12] != encrypted2[salt_end : salt_end + 12]
+        )
+
+    def test_cipher_cached_per_salt(self, service):
+        """Test that ciphers are reused for a repeated salt."""
+        salt = b"s" * service.kdf_config.salt_length
+
+        cipher = service._get_cipher(salt)
+
+        assert service._get_cipher(salt) is cipher
+        assert service._get_cipher(b"t" * service.kdf_config.salt_length) is not cipher
+
+    def test_cipher_cache_thread_safe(self, service):
+        """Test concurrent cipher lookups while the LRU cache evicts entries."""
+        salts = [
+            i.to_bytes(service.kdf_config.salt_length, "big")
+            for i in range(KEY_CACHE_SIZE * 2)
+        ]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ciphers = list(executor.map(service._get_cipher, salts * 4))
+
+        assert all(ciphers)
+        assert len(service._cipher_cache) == KEY_CACHE_SIZE
+
+    def test_master_key_derived_once(self, service):
+        """Test that the tenant master key is derived once and reused."""
+        service.encrypt("first")
+        master_key = service._master_key
+
+        service.encrypt("second")
+
+        assert master_key is not None
+        assert service._master_key is master_key
+
+    def test_encrypt_decrypt_scrypt(self, tenant_id, runtime_key):
+        """Test encryption with the scrypt KDF."""
+        service = TenantEncryptionService(
+            tenant_id,
+            runtime_key,
+            KDFConfig(algorithm="scrypt"),
+        )
+        encrypted = service.encrypt("scrypt message")
+
+        assert service.decrypt(encrypted) == "scrypt message"
+
+    def test_encrypt_decrypt_hkdf(self, tenant_id, runtime_key):
+        """Test encryption with the HKDF master-key derivation."""
+        service = TenantEncryptionService(
+            tenant_id,
+            runtime_key,
+            KDFConfig(algorithm="hkdf"),
+        )
+        encrypted = service.encrypt("hkdf message")
+
+        assert service.decrypt(encrypted) == "hkdf message"
+
+    @pytest.mark.parametrize("first_salt_byte", [0, 1], ids=["plain", "version"])
+    def test_decrypt_legacy_data(self, service, first_salt_byte):
+        """Test that unversioned data keyed per record salt still decrypts."""
+        salt = bytes((first_salt_byte,)) + os.urandom(
+            service.kdf_config.salt_length - 1,
+        )
+        nonce = os.urandom(12)
+        key = hash_secret_raw(
+            secret=str(service.tenant_id).encode() + service.runtime_key,
+            salt=salt,
+            time_cost=service.kdf_config.time_cost,
+            memory_cost=service.kdf_config.memory_cost,
+            parallelism=service.kdf_config.parallelism,
+            hash_len=service.kdf_config.key_length,
+            type=Type.ID,
+        )
+        legacy = salt + nonce + AESGCM(key).encrypt(nonce, b"legacy secret", None)
+
+        assert service.decrypt(legacy) == "legacy secret"
+
     def test_decrypt_invalid_data(self, service):
         """Test decryption of invalid data."""
         with pytest.raises(DecryptionError):
             service.decrypt(b"invalid encrypted data")
 
-    def test_tenant_isolation(self, runtime_key):
+    def test_tenant_isolation(self, runtime_key, fast_kdf_config):
         """Test that different tenants produce different encrypted data."""
         tenant1 = uuid4()
         tenant2 = uuid4()
 
-        service1 = TenantEncryptionService(tenant1, runtime_key)
-        service2 = TenantEncryptionService(tenant2, runtime_key)
+        service1 = TenantEncryptionService(tenant1, runtime_key, fast_kdf_config)
+        service2 = TenantEncryptionService(tenant2, runtime_key, fast_kdf_config)
 
         plaintext = "sensitive data"
         encrypted1 = service1.encrypt(plaintext)
@@ -146,15 +242,17 @@ class TestTenantEncryptionService:
 class TestEncryptionServiceManager:
     """Test encryption service manager."""
 
-    @pytest.fixture
-    def runtime_key(self):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def runtime_key(cls):
         """Generate test runtime key."""
         return EncryptionServiceManager.generate_runtime_key()
 
-    @pytest.fixture
-    def manager(self, runtime_key):
+    @pytest.fixture(scope="class")
+    @classmethod
+    def manager(cls, runtime_key, fast_kdf_config):
         """Create test service manager."""
-        return EncryptionServiceManager(runtime_key)
+        return EncryptionServiceManager(runtime_key, fast_kdf_config)
 
     def test_generate_runtime_key(self):
         """Test runtime key generation."""
@@ -3,31 +3,26 @@
 import pytest
 
 
-def test_scanner_initialization():
+def test_scanner_initialization(test_scanner):
     """Test DaggerScanner initialization."""
-    scanner = DaggerScanner(database_path=":memory:")
-    assert scanner.database is not None
-    assert scanner.parser_factory is not None
+    assert test_scanner.database is not None
+    assert test_scanner.parser_factory is not None
 
 
-def test_device_type_detection():
+def test_device_type_detection(test_scanner):
     """Test device type auto-detection."""
-    scanner = DaggerScanner(database_path=":memory:")
-
     # Test Cisco IOS detection
     ios_config = "hostname router\nversion 15.1\ninterface GigabitEthernet0/0"
-    device_type = scanner._detect_device_type(ios_config)
+    device_type = test_scanner._detect_device_type(ios_config)
     assert device_type.value == "cisco-ios"
 
     # Test unsupported device
     with pytest.raises(Exception):
-        scanner._detect_device_type("unknown config format")
+        test_scanner._detect_device_type("unknown config format")
 
 
-def test_severity_counting():
+def test_severity_counting(test_scanner):
     """Test severity counting functionality."""
-    scanner = DaggerScanner(database_path=":memory:")
-
     findings = [
         {"severity": "high"},
         {"severity": "medium"},
@@ -35,7 +30,7 @@ def test_severity_counting():
         {"severity": "high"},
     ]
 
-    counts = scanner._count_severities(findings)
+    counts = test_scanner._count_severities(findings)
     assert counts["high"] == 2
     assert counts["medium"] == 1
     assert counts["low"] == 1
@@ -0,0 +1,57 @@
+"""Unit tests for the shared base model helpers."""
+
+from concurrent.futures import ThreadPoolExecutor
+from uuid import UUID
+
+import pytest
+from pydantic import ConfigDict
+from sqlmodel import SQLModel
+
+from kp_dagger.models.base import base
+from kp_dagger.models.base.base import pooled_uuid, schema_example
+
+_EXAMPLE = {"name": "example"}
+
+
+def _model_with_example() -> type[SQLModel]:
+    """Define a model whose config requests a schema example."""
+
+    class ExampleModel(SQLModel):
+        """Model with an optional schema example."""
+
+        model_config = ConfigDict(json_schema_extra=schema_example(_EXAMPLE))
+
+        name: str
+
+    return ExampleModel
+
+
+def test_schema_example_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the example is attached when DAGGER_SCHEMA_EXAMPLES is set."""
+    monkeypatch.setenv("DAGGER_SCHEMA_EXAMPLES", "1")
+
+    assert schema_example(_EXAMPLE) == {"example": _EXAMPLE}
+    assert _model_with_example().model_json_schema()["example"] == _EXAMPLE
+
+
+def test_schema_example_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that no example is attached when DAGGER_SCHEMA_EXAMPLES is unset."""
+    monkeypatch.delenv("DAGGER_SCHEMA_EXAMPLES", raising=False)
+
+    assert schema_example(_EXAMPLE) is None
+    assert "example" not in _model_with_example().model_json_schema()
+
+
+def test_pooled_uuid_threaded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that concurrent callers never see an empty pool or a repeated UUID."""
+    monkeypatch.setattr(base, "_UUID_POOL_SIZE", 4)
+
+    def draw(_: int) -> list[UUID]:
+        return [pooled_uuid() for _ in range(2000)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        batches = list(executor.map(draw, range(8)))
+
+    uuids = [uuid for batch in batches for uuid in batch]
+    assert len(set(uuids)) == len(uuids) == 16000
+    assert all(uuid.version == 4 for uuid in uuids)
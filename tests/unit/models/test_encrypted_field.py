@@ -7,43 +7,69 @@ from sqlmodel import Field
 
 from kp_dagger.core.encryption import (
     EncryptionServiceManager,
+    KDFConfig,
     TenantEncryptionService,
 )
+from kp_dagger.models.base.base import KPDaggerBaseModel
 from kp_dagger.models.base.encryption import EncryptedField
 
 
-class TestModel(KPDaggerBaseModel, table=True):
-    """Test model with encrypted field."""
+@pytest.fixture(scope="session")
+def secret_model() -> type[KPDaggerBaseModel]:
+    """
+    Define the table model with encrypted fields.
 
-    __tablename__ = "test_models"
+    Built on first use rather than at import so that mapper configuration
+    runs once, after collection, and pytest does not try to collect it.
+    """
 
-    # Encrypted field
-    secret_data: str = EncryptedField("secret_data_encrypted")
-    secret_data_encrypted: bytes | None = Field(default=None, exclude=True)
+    class SecretModel(KPDaggerBaseModel, table=True):
+        """Test model with encrypted field."""
 
-    # Optional encrypted field
-    optional_secret: str = EncryptedField("optional_secret_encrypted", nullable=True)
-    optional_secret_encrypted: bytes | None = Field(default=None, exclude=True)
+        __tablename__ = "test_models"
+
+        # Encrypted field
+        secret_data = EncryptedField("secret_data_encrypted", nullable=False)
+        secret_data_encrypted: bytes | None = Field(default=None, exclude=True)
+
+        # Optional encrypted field
+        optional_secret = EncryptedField("optional_secret_encrypted", nullable=True)
+        optional_secret_encrypted: bytes | None = Field(default=None, exclude=True)
+
+    return SecretModel
 
 
 class TestEncryptedField:
     """Test encrypted field descriptor."""
 
-    @pytest.fixture
-    def encryption_service(self) -> TenantEncryptionService:
+    @pytest.fixture(scope="class")
+    @classmethod
+    def encryption_service(cls) -> TenantEncryptionService:
         """Create test encryption service."""
         tenant_id = uuid4()
         runtime_key = EncryptionServiceManager.generate_runtime_key()
-        return TenantEncryptionService(tenant_id, runtime_key)
+        # Cheap Argon2id parameters; these tests exercise the descriptor only
+        return TenantEncryptionService(
+            tenant_id,
+            runtime_key,
+            KDFConfig(time_cost=1, memory_cost=8),
+        )
 
     @pytest.fixture
-    def test_instance(self, encryption_service: TenantEncryptionService) -> TestModel:
+    def test_instance(
+        self,
+        secret_model: type[KPDaggerBaseModel],
+        encryption_service: TenantEncryptionService,
+    ) -> KPDaggerBaseModel:
         """Create test model instance with encryption service."""
-        instance = TestModel(tenant_id=uuid4())
+        instance = secret_model(tenant_id=encryption_service.tenant_id)
         instance.set_encryption_service(encryption_service)
         return instance
 
-    def test_set_and_get_encrypted_field(self, test_instance: TestModel) -> None:
+    def test_set_and_get_encrypted_field(
+        self,
+        test_instance: KPDaggerBaseModel,
+    ) -> None:
         """Test setting and getting encrypted field value."""
         secret_value = "super secret data"
 
@@ -58,19 +84,22 @@ class TestEncryptedField:
         # Check that we can retrieve the decrypted value
         assert test_instance.secret_data == secret_value
 
-    def test_set_none_nullable_field(self, test_instance: TestModel) -> None:
+    def test_set_none_nullable_field(self, test_instance: KPDaggerBaseModel) -> None:
         """Test setting None on nullable field."""
         test_instance.optional_secret = None
 
         assert test_instance.optional_secret is None
         assert test_instance.optional_secret_encrypted is None
 
-    def test_set_none_non_nullable_field(self, test_instance: TestModel) -> None:
+    def test_set_none_non_nullable_field(
+        self,
+        test_instance: KPDaggerBaseModel,
+    ) -> None:
         """Test setting None on non-nullable field raises error."""
         with pytest.raises(ValueError, match="cannot be None"):
             test_instance.secret_data = None
 
-    def test_caching_behavior(self, test_instance: TestModel) -> None:
+    def test_caching_behavior(self, test_instance: KPDaggerBaseModel) -> None:
         """Test that decrypted values are cached."""
         secret_value = "cached secret"
 
@@ -84,9 +113,39 @@ class TestEncryptedField:
         assert value1 == secret_value
         assert value2 == secret_value
 
-    def test_without_encryption_service(self) -> None:
+    def test_set_same_value_keeps_ciphertext(
+        self,
+        test_instance: KPDaggerBaseModel,
+    ) -> None:
+        """Test that assigning an unchanged value does not re-encrypt it."""
+        test_instance.secret_data = "unchanged secret"
+        encrypted = test_instance.secret_data_encrypted
+
+        test_instance.secret_data = "unchanged secret"
+
+        assert test_instance.secret_data_encrypted is encrypted
+
+    def test_constructor_keyword_encrypted(
+        self,
+        secret_model: type[KPDaggerBaseModel],
+        encryption_service: TenantEncryptionService,
+    ) -> None:
+        """Test that encrypted fields passed to the constructor are stored."""
+        instance = secret_model(
+            tenant_id=encryption_service.tenant_id,
+            secret_data="constructor secret",
+            _encryption_service=encryption_service,
+        )
+
+        assert instance.secret_data_encrypted is not None
+        assert instance.secret_data == "constructor secret"
+
+    def test_without_encryption_service(
+        self,
+        secret_model: type[KPDaggerBaseModel],
+    ) -> None:
         """Test that accessing encrypted field without service raises error."""
-        instance = TestModel(tenant_id=uuid4())
+        instance = secret_model(tenant_id=uuid4())
 
         with pytest.raises(RuntimeError, match="Encryption service not available"):
             instance.secret_data = "test"
@@ -97,7 +156,7 @@ class TestEncryptedField:
         with pytest.raises(RuntimeError, match="Encryption service not available"):
             _ = instance.secret_data
 
-    def test_corrupted_data_handling(self, test_instance: TestModel) -> None:
+    def test_corrupted_data_handling(self, test_instance: KPDaggerBaseModel) -> None:
         """Test that corrupted encrypted data returns None."""
         # Set invalid encrypted data
         test_instance.secret_data_encrypted = b"corrupted data"
@@ -105,7 +164,7 @@ class TestEncryptedField:
         # Should return None instead of raising exception
         assert test_instance.secret_data is None
 
-    def test_model_dump_encrypted(self, test_instance: TestModel) -> None:
+    def test_model_dump_encrypted(self, test_instance: KPDaggerBaseModel) -> None:
         """Test dumping model with encrypted fields."""
         test_instance.secret_data = "secret value"
         test_instance.optional_secret = "optional secret"
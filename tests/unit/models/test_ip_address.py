@@ -0,0 +1,160 @@
+"""Unit tests for the normalized IP address model."""
+
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import text
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from kp_dagger.core.encryption import KDFConfig, TenantEncryptionService
+from kp_dagger.models.base.tenant import Tenant  # noqa: F401
+from kp_dagger.models.normalized.device import Device  # noqa: F401
+from kp_dagger.models.normalized.ip_address import (
+    FLAG_LOOPBACK,
+    FLAG_MULTICAST,
+    FLAG_PRIVATE,
+    IPAddress,
+    address_flags,
+)
+
+
+@pytest.mark.parametrize(
+    ("address", "expected"),
+    [
+        ("10.1.2.3", FLAG_PRIVATE),
+        ("192.168.0.0/16", FLAG_PRIVATE),
+        ("127.0.0.1", FLAG_PRIVATE | FLAG_LOOPBACK),
+        ("224.0.0.5", FLAG_MULTICAST),
+        ("8.8.8.8", 0),
+        ("any", 0),
+    ],
+)
+def test_address_flags(address: str, expected: int) -> None:
+    """Test address classification into the flags bitmask."""
+    assert address_flags(address) == expected
+
+
+def test_flag_properties() -> None:
+    """Test that the classification properties read the flags bitmask."""
+    ip = IPAddress(tenant_id=uuid4(), version="ipv4", flags=FLAG_LOOPBACK)
+
+    assert ip.is_loopback
+    assert not ip.is_private
+    assert not ip.is_multicast
+
+
+def test_flags_derived_from_address() -> None:
+    """Test that single-row construction classifies the address."""
+    encryption_service = TenantEncryptionService(
+        uuid4(),
+        b"a" * 32,
+        KDFConfig(algorithm="hkdf"),
+    )
+    ip = IPAddress(
+        tenant_id=encryption_service.tenant_id,
+        version="ipv4",
+        normalized_address="10.0.0.1",
+        _encryption_service=encryption_service,
+    )
+
+    assert ip.flags == FLAG_PRIVATE
+    assert ip.is_private
+
+
+def test_flag_property_keywords_rejected() -> None:
+    """Test that the derived classification properties are not keywords."""
+    with pytest.raises(TypeError, match="is_private"):
+        IPAddress(tenant_id=uuid4(), version="ipv4", is_private=True)
+
+
+def test_bulk_create_unique() -> None:
+    """Test that repeated addresses are created and encrypted once."""
+    encryption_service = TenantEncryptionService(
+        uuid4(),
+        b"a" * 32,
+        KDFConfig(algorithm="pbkdf2"),
+    )
+    tenant_id = uuid4()
+    rows = [
+        {"tenant_id": tenant_id, "version": "ipv4", "original_address": address}
+        for address in ("10.0.0.1", "10.0.0.2", "10.0.0.1")
+    ]
+
+    records = IPAddress.bulk_create_unique(rows, encryption_service)
+
+    assert list(records) == ["10.0.0.1", "10.0.0.2"]
+    assert records["10.0.0.1"].original_address == "10.0.0.1"
+    assert records["10.0.0.1"].created_at == records["10.0.0.2"].created_at
+
+
+@pytest.mark.parametrize(
+    "invalid",
+    [{"version": "ipv5"}, {"prefix_length": 999}, {"flags": 77}],
+)
+def test_bulk_create_validates_rows(invalid: dict[str, object]) -> None:
+    """Test that bulk-created rows are checked against the field constraints."""
+    encryption_service = TenantEncryptionService(
+        uuid4(),
+        b"a" * 32,
+        KDFConfig(algorithm="hkdf"),
+    )
+    row = {"tenant_id": uuid4(), "version": "ipv4", **invalid}
+
+    with pytest.raises(ValidationError):
+        IPAddress.bulk_create([row], encryption_service)
+
+
+class TestIPAddressBulkInsert:
+    """Test batched IP address inserts."""
+
+    @pytest.fixture
+    def encryption_service(self) -> TenantEncryptionService:
+        """Create test encryption service."""
+        return TenantEncryptionService(
+            uuid4(),
+            b"a" * 32,
+            KDFConfig(algorithm="pbkdf2"),
+        )
+
+    @pytest.fixture
+    def session(self):
+        """Create an in-memory database session."""
+        engine = create_engine("sqlite://")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            yield session
+
+    def test_bulk_insert(self, session, encryption_service) -> None:
+        """Test that bulk-inserted rows round-trip through the database."""
+        tenant_id = uuid4()
+        rows = [
+            {
+                "tenant_id": tenant_id,
+                "version": "ipv4",
+                "original_address": "10.0.0.1",
+                "normalized_address": "10.0.0.1",
+            },
+            {"tenant_id": tenant_id, "version": "ipv6", "original_address": "::1"},
+        ]
+
+        records = IPAddress.bulk_insert(session, rows, encryption_service)
+        session.commit()
+
+        stored = {ip.id: ip for ip in session.exec(select(IPAddress))}
+        assert list(stored) == [record.id for record in records]
+        for record in records:
+            ip = stored[record.id]
+            ip.set_encryption_service(encryption_service)
+            assert ip.original_address == record.original_address
+            assert ip.normalized_address == record.normalized_address
+            assert ip.flags == record.flags
+            assert ip.version == record.version
+        assert records[0].flags == FLAG_PRIVATE
+        codes = session.execute(text("SELECT version FROM ip_addresses")).scalars()
+        assert sorted(codes) == [4, 6]
+
+    def test_bulk_insert_empty(self, session, encryption_service) -> None:
+        """Test that an empty batch inserts nothing."""
+        assert IPAddress.bulk_insert(session, [], encryption_service) == []
+        assert session.exec(select(IPAddress)).all() == []
@@ -0,0 +1,49 @@
+"""Test the parser factory."""
+
+import pytest
+
+from kp_dagger.core.exceptions import UnsupportedDeviceError
+from kp_dagger.models.base.enums import DeviceType
+from kp_dagger.parsers import factory
+from kp_dagger.parsers.factory import ParserFactory
+
+
+@pytest.fixture
+def broken_paloalto(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Register a Palo Alto parser whose module cannot be imported."""
+    monkeypatch.setattr(factory, "_PARSERS", {})
+    monkeypatch.setattr(factory, "_UNAVAILABLE", set())
+    monkeypatch.setitem(
+        factory._PARSER_PATHS,
+        DeviceType.PALOALTO,
+        ("kp_dagger.parsers.missing", "MissingParser"),
+    )
+
+
+def test_supported_types_include_all_parsers() -> None:
+    """Test that every registered parser imports and is reported."""
+    assert ParserFactory().get_supported_device_types() == [
+        DeviceType.CISCO_IOS,
+        DeviceType.CISCO_ASA,
+        DeviceType.FORTIGATE,
+        DeviceType.PALOALTO,
+    ]
+
+
+@pytest.mark.usefixtures("broken_paloalto")
+def test_supported_types_skip_unimportable_parsers() -> None:
+    """Test that parsers which fail to import are not reported as supported."""
+    assert DeviceType.PALOALTO not in ParserFactory().get_supported_device_types()
+
+
+@pytest.mark.usefixtures("broken_paloalto")
+def test_unimportable_parser_error_lists_available_types() -> None:
+    """Test that the error for a broken parser lists only loadable types."""
+    with pytest.raises(UnsupportedDeviceError) as exc_info:
+        ParserFactory().get_parser(DeviceType.PALOALTO)
+
+    assert exc_info.value.supported_types == [
+        DeviceType.CISCO_IOS.value,
+        DeviceType.CISCO_ASA.value,
+        DeviceType.FORTIGATE.value,
+    ]